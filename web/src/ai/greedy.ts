@@ -9,7 +9,8 @@
 
 import type { GameState, PlayerAction, PassAction } from '@engine/models';
 import { getLocation, getPlayer, getTotalPower, getCardCount } from '@engine/models';
-import type { PlayerId, LocationIndex } from '@engine/types';
+import type { PlayerId } from '@engine/types';
+import { ALL_LOCATIONS, getOpponentId } from '@engine/types';
 import { getLegalActions, resolveTurnDeterministic } from '@engine/controller';
 import { SeededRNG } from '@engine/rng';
 
@@ -88,11 +89,13 @@ export function resetSimulationRng(seed: number = 12345): void {
  * @param state - Current game state
  * @param playerId - The player ID making the decision (typically 1 for NPC)
  * @param difficulty - Optional difficulty configuration (defaults to hard)
+ * @param rng - RNG for blunders and noise (defaults to the shared simulation RNG)
  */
 export function computeGreedyAction(
   state: GameState,
   playerId: PlayerId,
-  difficulty: DifficultyConfig = DEFAULT_DIFFICULTY
+  difficulty: DifficultyConfig = DEFAULT_DIFFICULTY,
+  rng: SeededRNG = simulationRng
 ): PlayerAction {
   const legalActions = getLegalActions(state, playerId);
   
@@ -107,11 +110,11 @@ export function computeGreedyAction(
   
   // Blunder check: with some probability, make a completely random move
   // This makes the AI feel more human and helps beginners win
-  if (difficulty.blunderChance > 0 && simulationRng.next() < difficulty.blunderChance) {
+  if (difficulty.blunderChance > 0 && rng.next() < difficulty.blunderChance) {
     // Pick a random non-pass action if available, otherwise pass
     const nonPassActions = legalActions.filter(a => a.type !== 'Pass');
     if (nonPassActions.length > 0) {
-      const randomIndex = Math.floor(simulationRng.next() * nonPassActions.length);
+      const randomIndex = Math.floor(rng.next() * nonPassActions.length);
       return nonPassActions[randomIndex]!;
     }
   }
@@ -121,7 +124,7 @@ export function computeGreedyAction(
   
   // Evaluate current state with noise
   const currentScore = evaluateState(state, playerId) + 
-    (difficulty.evaluationNoise > 0 ? (simulationRng.next() - 0.5) * difficulty.evaluationNoise : 0);
+    (difficulty.evaluationNoise > 0 ? (rng.next() - 0.5) * difficulty.evaluationNoise : 0);
   
   for (const action of legalActions) {
     if (action.type === 'Pass') {
@@ -134,11 +137,11 @@ export function computeGreedyAction(
     }
     
     // Simulate this action (opponent passes) using DETERMINISTIC resolution
-    const opponentId = (1 - playerId) as PlayerId;
+    const opponentId = getOpponentId(playerId);
     const opponentPass: PassAction = { type: 'Pass', playerId: opponentId };
     
     // Clone RNG state for simulation to avoid affecting the real game
-    const simRng = simulationRng.clone();
+    const simRng = rng.clone();
     
     const result = resolveTurnDeterministic(
       state,
@@ -149,12 +152,12 @@ export function computeGreedyAction(
     
     // Add evaluation noise to mask the true best plays (easier difficulties)
     const evaluationNoise = difficulty.evaluationNoise > 0 
-      ? (simulationRng.next() - 0.5) * difficulty.evaluationNoise 
+      ? (rng.next() - 0.5) * difficulty.evaluationNoise 
       : 0;
     const score = evaluateState(result.state, playerId) + evaluationNoise;
     
     // Add randomness to avoid predictable play (scaled by difficulty)
-    const randomBonus = simulationRng.next() * difficulty.randomnessFactor;
+    const randomBonus = rng.next() * difficulty.randomnessFactor;
     
     if (score + randomBonus > bestScore) {
       bestScore = score + randomBonus;
@@ -171,11 +174,11 @@ export function computeGreedyAction(
  */
 function evaluateState(state: GameState, playerId: PlayerId): number {
   let score = 0;
-  const enemyId = (1 - playerId) as PlayerId;
+  const enemyId = getOpponentId(playerId);
   
   // Evaluate each location
-  for (let i = 0; i < 3; i++) {
-    const location = getLocation(state, i as LocationIndex);
+  for (const locIdx of ALL_LOCATIONS) {
+    const location = getLocation(state, locIdx);
     const myPower = getTotalPower(location, playerId);
     const enemyPower = getTotalPower(location, enemyId);
     const myCards = getCardCount(location, playerId);
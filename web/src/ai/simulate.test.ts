@@ -0,0 +1,58 @@
+/**
+ * Tests for headless AI-vs-AI simulation.
+ *
+ * Tests cover:
+ * - simulateGame() - plays a full game to a final result
+ * - simulateGames() - result tallies
+ * - Games are reproducible from the seed
+ * - The game's shared AI RNG is left untouched
+ */
+
+import { describe, it, expect } from 'vitest';
+import { MAX_TURNS } from '@engine/types';
+import { createGameWithSeed } from '@engine/controller';
+import { simulateGame, simulateGames } from './simulate';
+import { computeGreedyAction, resetSimulationRng, DIFFICULTY_LEVELS } from './greedy';
+
+describe('simulateGame', () => {
+  it('should play a game through to a final result', () => {
+    const game = simulateGame(7);
+
+    expect(game.seed).toBe(7);
+    expect(game.result).not.toBe('IN_PROGRESS');
+    expect(game.finalState.result).toBe(game.result);
+    expect(game.finalState.turn).toBe(MAX_TURNS);
+    expect(game.locationPowers).toHaveLength(3);
+  });
+
+  it('should replay identically from the same seed', () => {
+    expect(simulateGame(5)).toEqual(simulateGame(5));
+  });
+
+  it('should not consume the shared AI RNG', () => {
+    const { state } = createGameWithSeed(42);
+
+    resetSimulationRng(99);
+    const expected = [0, 1, 2].map(() => computeGreedyAction(state, 1, DIFFICULTY_LEVELS.easy));
+
+    resetSimulationRng(99);
+    simulateGame(7, { difficulty: [DIFFICULTY_LEVELS.easy, DIFFICULTY_LEVELS.easy] });
+    const actual = [0, 1, 2].map(() => computeGreedyAction(state, 1, DIFFICULTY_LEVELS.easy));
+
+    expect(actual).toEqual(expected);
+  });
+});
+
+describe('simulateGames', () => {
+  it('should tally one result per game over consecutive seeds', () => {
+    const summary = simulateGames(3, 10);
+
+    expect(summary.games).toBe(3);
+    expect(summary.results.map(r => r.seed)).toEqual([10, 11, 12]);
+    expect(summary.p0Wins + summary.p1Wins + summary.draws).toBe(3);
+  });
+
+  it('should produce the same summary for the same base seed', () => {
+    expect(simulateGames(3, 20)).toEqual(simulateGames(3, 20));
+  });
+});
@@ -0,0 +1,136 @@
+/**
+ * Headless self-play for balance testing.
+ *
+ * Plays complete AI-vs-AI games straight through the engine, without the
+ * store, animation delays or any rendering. Both sides use the greedy AI
+ * and the same turn flow as the game store: plan plays from the turn-start
+ * state, resolve them in pairs, then start the next turn.
+ *
+ * Games are reproducible from the seed: deck shuffles, turn-start draws,
+ * AI choices and resolution all use seeded RNGs.
+ */
+
+import type { GameState, PlayerAction, PlayCardAction } from '@engine/models';
+import type { CardId, GameResult, PlayerId } from '@engine/types';
+import { MAX_TURNS } from '@engine/types';
+import {
+  createGameWithSeed,
+  resolveTurnDeterministic,
+  startNextTurn,
+  validateAction,
+  computeWinner,
+  applyCardPlay,
+} from '@engine/controller';
+import { SeededRNG, generateGameSeed } from '@engine/rng';
+import { computeGreedyAction, DIFFICULTY_LEVELS } from './greedy';
+import type { DifficultyConfig } from './greedy';
+
+// =============================================================================
+// Types
+// =============================================================================
+
+export interface SimulationOptions {
+  /** Deck for player 0 (defaults to the starter deck) */
+  playerDeckIds?: CardId[];
+  /** Unlock position used to build player 1's deck */
+  unlockPosition?: number;
+  /** AI difficulty for each player (defaults to hard for both) */
+  difficulty?: readonly [DifficultyConfig, DifficultyConfig];
+}
+
+export interface SimulationResult {
+  seed: number;
+  result: GameResult;
+  locationPowers: [number, number][];
+  finalState: GameState;
+}
+
+export interface SimulationSummary {
+  games: number;
+  p0Wins: number;
+  p1Wins: number;
+  draws: number;
+  results: SimulationResult[];
+}
+
+// =============================================================================
+// Simulation
+// =============================================================================
+
+/**
+ * Let the AI pick plays for one player until it passes.
+ */
+function planActions(
+  state: GameState,
+  playerId: PlayerId,
+  difficulty: DifficultyConfig,
+  rng: SeededRNG
+): PlayCardAction[] {
+  const actions: PlayCardAction[] = [];
+  let planState = state;
+  // eslint-disable-next-line no-constant-condition
+  while (true) {
+    const action = computeGreedyAction(planState, playerId, difficulty, rng);
+    if (action.type === 'Pass') break;
+    if (!validateAction(planState, action).valid) break;
+    actions.push(action);
+    planState = applyCardPlay(planState, action);
+  }
+  return actions;
+}
+
+/**
+ * Play one complete AI-vs-AI game.
+ */
+export function simulateGame(seed: number, options: SimulationOptions = {}): SimulationResult {
+  const difficulty = options.difficulty ?? [DIFFICULTY_LEVELS.hard, DIFFICULTY_LEVELS.hard];
+  // The AI gets its own RNG so simulations leave the game's AI RNG untouched
+  const aiRng = new SeededRNG(seed);
+
+  // Turn-start draws continue the RNG that shuffled the decks
+  const game = createGameWithSeed(seed, options.playerDeckIds, options.unlockPosition);
+  const drawRng = game.rng;
+  let state = game.state;
+
+  // eslint-disable-next-line no-constant-condition
+  while (true) {
+    const turnRng = new SeededRNG(generateGameSeed(String(seed), state.turn));
+    const actions0 = planActions(state, 0, difficulty[0], aiRng);
+    const actions1 = planActions(state, 1, difficulty[1], aiRng);
+
+    // Resolve plays in pairs; an empty turn still resolves once
+    const maxPlays = Math.max(actions0.length, actions1.length, 1);
+    for (let i = 0; i < maxPlays; i++) {
+      const action0: PlayerAction = actions0[i] ?? { type: 'Pass', playerId: 0 };
+      const action1: PlayerAction = actions1[i] ?? { type: 'Pass', playerId: 1 };
+      state = resolveTurnDeterministic(state, action0, action1, turnRng).state;
+    }
+
+    if (state.result !== 'IN_PROGRESS' || state.turn >= MAX_TURNS) break;
+    state = startNextTurn(state, drawRng).state;
+  }
+
+  const { result, locationPowers } = computeWinner(state);
+  return { seed, result, locationPowers, finalState: state };
+}
+
+/**
+ * Play a batch of games with consecutive seeds and tally the results.
+ */
+export function simulateGames(
+  count: number,
+  baseSeed: number = 1,
+  options: SimulationOptions = {}
+): SimulationSummary {
+  const summary: SimulationSummary = { games: count, p0Wins: 0, p1Wins: 0, draws: 0, results: [] };
+
+  for (let i = 0; i < count; i++) {
+    const game = simulateGame(baseSeed + i, options);
+    summary.results.push(game);
+    if (game.result === 'PLAYER_0_WINS') summary.p0Wins++;
+    else if (game.result === 'PLAYER_1_WINS') summary.p1Wins++;
+    else summary.draws++;
+  }
+
+  return summary;
+}
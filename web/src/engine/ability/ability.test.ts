@@ -7,14 +7,20 @@
  * 3. Target selection with proper tie-breaking
  * 4. Effect application
  * 5. Timeline generation and execution
+ * 6. Multi-target effects committed in one state update
  */
 
 import { describe, it, expect } from 'vitest';
 import { SeededRNG, verifyDeterminism } from '../rng';
 import { evaluateCondition, createConditionSnapshot } from './conditions';
 import { resolveTargets, findMoveDestination } from './selectors';
+import { applyEffect } from './effects';
+import type { EffectType } from './types';
 import type { GameState, CardInstance, LocationState } from '../models';
-import type { LocationIndex, PlayerId, TurnNumber, CardTag } from '../types';
+import { getEffectivePower } from '../models';
+import type { Step } from '../timeline/types';
+import { createEventStep, createCardSource } from '../timeline/types';
+import type { InstanceId, LocationIndex, PlayerId, TurnNumber, CardTag } from '../types';
 
 // =============================================================================
 // Test Fixtures
@@ -85,6 +91,35 @@ function createTestGameState(
   };
 }
 
+function createEffectStep(
+  source: CardInstance,
+  effect: EffectType,
+  targets: readonly InstanceId[],
+  value: number = 0
+): Step {
+  return createEventStep(
+    0,
+    createCardSource(source.instanceId, source.owner),
+    'ON_REVEAL',
+    'NONE',
+    targets,
+    effect,
+    value,
+    'INSTANT',
+    { visualEffectType: 'GLOW', intensity: 'MEDIUM', affectedEntities: targets }
+  );
+}
+
+function findPower(state: GameState, instanceId: InstanceId): number | undefined {
+  for (const location of state.locations) {
+    for (const cards of location.cardsByPlayer) {
+      const card = cards.find(c => c.instanceId === instanceId);
+      if (card) return getEffectivePower(card);
+    }
+  }
+  return undefined;
+}
+
 // =============================================================================
 // Seeded RNG Tests
 // =============================================================================
@@ -447,3 +482,98 @@ describe('createConditionSnapshot', () => {
     expect(snapshot.locationCapacity).toBe(4);
   });
 });
+
+// =============================================================================
+// Multi-target Effect Tests
+// =============================================================================
+
+describe('applyEffect with multiple targets', () => {
+  it('buffs every target with the same powers and events as one at a time', () => {
+    const source = createTestCard(1, 0);
+    const state = createTestGameState([
+      createTestLocation(0, [source, createTestCard(2, 0, 3), createTestCard(3, 0, 4)]),
+      createTestLocation(1, [createTestCard(5, 0, 2)]),
+      createTestLocation(2),
+    ]);
+    const targets = [3, 2, 5, 42]; // 42 is not on the board
+    
+    const batched = applyEffect(state, createEffectStep(source, 'BUFF_ALLIES_HERE', targets, 2), new SeededRNG(42));
+    
+    let sequential = state;
+    const sequentialEvents = [];
+    for (const targetId of targets) {
+      const result = applyEffect(sequential, createEffectStep(source, 'BUFF_ALLIES_HERE', [targetId], 2), new SeededRNG(42));
+      sequential = result.state;
+      sequentialEvents.push(...result.events);
+    }
+    
+    expect(batched.state.locations).toEqual(sequential.locations);
+    expect(batched.events).toEqual(sequentialEvents);
+    expect(batched.events).toEqual([
+      { type: 'PowerChanged', cardInstanceId: 3, oldPower: 4, newPower: 6, sourceCardId: 1 },
+      { type: 'PowerChanged', cardInstanceId: 2, oldPower: 3, newPower: 5, sourceCardId: 1 },
+      { type: 'PowerChanged', cardInstanceId: 5, oldPower: 2, newPower: 4, sourceCardId: 1 },
+    ]);
+    expect(findPower(batched.state, 1)).toBe(3); // Source is not a target
+  });
+  
+  it('destroys several targets in one update, in target order', () => {
+    const source = createTestCard(1, 0);
+    const state = createTestGameState([
+      createTestLocation(0, [source], [createTestCard(10, 1)]),
+      createTestLocation(1),
+      createTestLocation(2, [], [createTestCard(11, 1), createTestCard(12, 1)]),
+    ], 1, { cardsDestroyedThisGame: [99] });
+    
+    const result = applyEffect(state, createEffectStep(source, 'DESTROY_ONE_ENEMY_HERE', [11, 10, 42]), new SeededRNG(42));
+    
+    expect(result.state.cardsDestroyedThisGame).toEqual([99, 11, 10]);
+    expect(result.events).toEqual([
+      { type: 'CardDestroyed', cardInstanceId: 11, location: 2, sourceCardId: 1 },
+      { type: 'CardDestroyed', cardInstanceId: 10, location: 0, sourceCardId: 1 },
+    ]);
+    expect(result.state.locations[0].cardsByPlayer[1]).toEqual([]);
+    expect(result.state.locations[2].cardsByPlayer[1].map(c => c.instanceId)).toEqual([12]);
+  });
+  
+  it('silences each target once, keeping existing silences first', () => {
+    const source = createTestCard(1, 0);
+    const state = createTestGameState([
+      createTestLocation(0, [source], [createTestCard(10, 1), createTestCard(11, 1), createTestCard(12, 1)]),
+      createTestLocation(1),
+      createTestLocation(2),
+    ], 1, { silencedCards: [12] });
+    
+    const result = applyEffect(state, createEffectStep(source, 'SILENCE_ENEMY_ONGOING_HERE', [10, 11, 10, 12]), new SeededRNG(42));
+    expect(result.state.silencedCards).toEqual([12, 10, 11]);
+    
+    // Silencing the same cards again changes nothing
+    const again = applyEffect(result.state, createEffectStep(source, 'SILENCE_ENEMY_ONGOING_HERE', [11, 10]), new SeededRNG(42));
+    expect(again.state).toBe(result.state);
+  });
+  
+  it('moves a card by updating both locations together', () => {
+    const source = createTestCard(1, 0);
+    const fullEnemySide = [20, 21, 22, 23].map(id => createTestCard(id, 1));
+    const state = createTestGameState([
+      createTestLocation(0, [source], [createTestCard(10, 1)]),
+      createTestLocation(1, [], fullEnemySide),
+      createTestLocation(2, [createTestCard(30, 0)], [createTestCard(31, 1)]),
+    ]);
+    
+    const result = applyEffect(state, createEffectStep(source, 'MOVE_ONE_ENEMY_TO_OTHER_LOCATION', [10]), new SeededRNG(42));
+    const [loc0, loc1, loc2] = result.state.locations;
+    
+    // Location 1 is full for the enemy, so the card lands at location 2
+    expect(loc0.cardsByPlayer[0]).toEqual([source]);
+    expect(loc0.cardsByPlayer[1]).toEqual([]);
+    expect(loc1).toBe(state.locations[1]);
+    expect(loc2.cardsByPlayer[0].map(c => c.instanceId)).toEqual([30]);
+    expect(loc2.cardsByPlayer[1].map(c => c.instanceId)).toEqual([31, 10]);
+    expect(result.state.cardsMovedThisGame).toEqual([10]);
+    expect(result.state.cardsMovedThisTurn).toEqual([10]);
+    expect(result.events).toEqual([
+      { type: 'CardMoved', cardInstanceId: 10, fromLocation: 0, toLocation: 2, sourceCardId: 1 },
+    ]);
+  });
+});
@@ -8,8 +8,8 @@
  * They do NOT re-evaluate during execution.
  */
 
-import type { GameState, CardInstance } from '../models';
-import type { LocationIndex, PlayerId } from '../types';
+import type { GameState, CardInstance, LocationState } from '../models';
+import type { LocationIndex } from '../types';
 import type { Condition } from './types';
 import {
   getLocation,
@@ -18,7 +18,108 @@ import {
   getTotalPower,
   getEffectivePower,
 } from '../models';
-import { LOCATION_CAPACITY } from '../types';
+import { LOCATION_CAPACITY, getOpponentId } from '../types';
+
+// =============================================================================
+// Condition Evaluators
+// =============================================================================
+
+/**
+ * Evaluates one condition for a source card at its location.
+ */
+type ConditionEvaluator = (
+  state: GameState,
+  sourceCard: CardInstance,
+  location: LocationState
+) => boolean;
+
+/**
+ * One evaluator per condition, built once at module load so evaluation is a
+ * table lookup plus a direct call.
+ */
+const CONDITION_EVALUATORS: Record<Condition, ConditionEvaluator> = {
+  // =======================================================================
+  // Always True
+  // =======================================================================
+  'NONE': () => true,
+  
+  // =======================================================================
+  // Ally Count Conditions
+  // =======================================================================
+  // Exactly 1 other allied card here (so total count is 2 including self)
+  'CONDITIONAL_EXACTLY_ONE_OTHER_ALLY_HERE': (_state, sourceCard, location) =>
+    getCardCount(location, sourceCard.owner) === 2,
+  
+  // Exactly 2 allied cards here (including self if applicable)
+  'CONDITIONAL_EXACTLY_TWO_ALLIES_HERE': (_state, sourceCard, location) =>
+    getCardCount(location, sourceCard.owner) === 2,
+  
+  // This is the only card here for this player
+  'CONDITIONAL_ONLY_CARD_HERE': (_state, sourceCard, location) =>
+    getCardCount(location, sourceCard.owner) === 1,
+  
+  // =======================================================================
+  // Location Capacity Conditions
+  // =======================================================================
+  // Player has 4 cards at this location
+  'CONDITIONAL_LOCATION_FULL': (_state, sourceCard, location) =>
+    getCardCount(location, sourceCard.owner) >= LOCATION_CAPACITY,
+  
+  // Player has < 4 cards at this location (has empty slot)
+  'CONDITIONAL_EMPTY_SLOT_HERE': (_state, sourceCard, location) =>
+    getCardCount(location, sourceCard.owner) < LOCATION_CAPACITY,
+  
+  // =======================================================================
+  // Enemy Count Conditions
+  // =======================================================================
+  // Enemy has more cards here than player
+  'CONDITIONAL_ENEMY_MORE_CARDS_HERE': (_state, sourceCard, location) =>
+    getCardCount(location, getOpponentId(sourceCard.owner)) > getCardCount(location, sourceCard.owner),
+  
+  // Enemy has 3+ cards here
+  'CONDITIONAL_ENEMY_3PLUS_HERE': (_state, sourceCard, location) =>
+    getCardCount(location, getOpponentId(sourceCard.owner)) >= 3,
+  
+  // =======================================================================
+  // Power-based Conditions
+  // =======================================================================
+  // Check if there's an enemy with the highest power at this location
+  'CONDITIONAL_ENEMY_HIGHEST_POWER_HERE': (_state, sourceCard, location) => {
+    const enemyCards = getCards(location, getOpponentId(sourceCard.owner));
+    if (enemyCards.length === 0) return false;
+    
+    // Find highest power among enemies
+    const highestPower = Math.max(...enemyCards.map(c => getEffectivePower(c)));
+    
+    // Check if any enemy has this power
+    return enemyCards.some(c => getEffectivePower(c) === highestPower);
+  },
+  
+  // Player is currently losing this location (enemy has more power)
+  'CONDITIONAL_LOSING_LOCATION': (_state, sourceCard, location) =>
+    getTotalPower(location, getOpponentId(sourceCard.owner)) > getTotalPower(location, sourceCard.owner),
+  
+  // =======================================================================
+  // Game History Conditions
+  // =======================================================================
+  // Check if a card was moved by this player this turn
+  'CONDITIONAL_MOVED_BY_YOU_THIS_TURN': (state) => state.cardsMovedThisTurn.length > 0,
+  
+  // Check if any card has been destroyed this game
+  'CONDITIONAL_DESTROYED_THIS_GAME': (state) => state.cardsDestroyedThisGame.length > 0,
+  
+  // Check if any card has been moved this game
+  'CONDITIONAL_MOVED_THIS_GAME': (state) => state.cardsMovedThisGame.length > 0,
+  
+  // =======================================================================
+  // Card Property Conditions
+  // =======================================================================
+  // Check if the source card has the 'Buff' tag
+  'CONDITIONAL_CARD_HAS_BUFF_TAG': (_state, sourceCard) => sourceCard.cardDef.tags.includes('Buff'),
+  
+  // Check if the source card has ONGOING ability type
+  'CONDITIONAL_CARD_HAS_ONGOING': (_state, sourceCard) => sourceCard.cardDef.abilityType === 'ONGOING',
+};
 
 // =============================================================================
 // Core Condition Evaluator
@@ -39,131 +140,13 @@ export function evaluateCondition(
   sourceCard: CardInstance,
   sourceLocation: LocationIndex
 ): boolean {
-  const sourcePlayer = sourceCard.owner;
-  const enemyPlayer = (1 - sourcePlayer) as PlayerId;
-  const location = getLocation(state, sourceLocation);
-  
-  switch (condition) {
-    // =======================================================================
-    // Always True
-    // =======================================================================
-    case 'NONE':
-      return true;
-    
-    // =======================================================================
-    // Ally Count Conditions
-    // =======================================================================
-    case 'CONDITIONAL_EXACTLY_ONE_OTHER_ALLY_HERE': {
-      // Exactly 1 other allied card here (so total count is 2 including self)
-      const allyCount = getCardCount(location, sourcePlayer);
-      return allyCount === 2;
-    }
-    
-    case 'CONDITIONAL_EXACTLY_TWO_ALLIES_HERE': {
-      // Exactly 2 allied cards here (including self if applicable)
-      const allyCount = getCardCount(location, sourcePlayer);
-      return allyCount === 2;
-    }
-    
-    case 'CONDITIONAL_ONLY_CARD_HERE': {
-      // This is the only card here for this player
-      const allyCount = getCardCount(location, sourcePlayer);
-      return allyCount === 1;
-    }
-    
-    // =======================================================================
-    // Location Capacity Conditions
-    // =======================================================================
-    case 'CONDITIONAL_LOCATION_FULL': {
-      // Player has 4 cards at this location
-      const allyCount = getCardCount(location, sourcePlayer);
-      return allyCount >= LOCATION_CAPACITY;
-    }
-    
-    case 'CONDITIONAL_EMPTY_SLOT_HERE': {
-      // Player has < 4 cards at this location (has empty slot)
-      const allyCount = getCardCount(location, sourcePlayer);
-      return allyCount < LOCATION_CAPACITY;
-    }
-    
-    // =======================================================================
-    // Enemy Count Conditions
-    // =======================================================================
-    case 'CONDITIONAL_ENEMY_MORE_CARDS_HERE': {
-      // Enemy has more cards here than player
-      const allyCount = getCardCount(location, sourcePlayer);
-      const enemyCount = getCardCount(location, enemyPlayer);
-      return enemyCount > allyCount;
-    }
-    
-    case 'CONDITIONAL_ENEMY_3PLUS_HERE': {
-      // Enemy has 3+ cards here
-      const enemyCount = getCardCount(location, enemyPlayer);
-      return enemyCount >= 3;
-    }
-    
-    // =======================================================================
-    // Power-based Conditions
-    // =======================================================================
-    case 'CONDITIONAL_ENEMY_HIGHEST_POWER_HERE': {
-      // Check if there's an enemy with the highest power at this location
-      const enemyCards = getCards(location, enemyPlayer);
-      if (enemyCards.length === 0) return false;
-      
-      // Find highest power among enemies
-      const highestPower = Math.max(...enemyCards.map(c => getEffectivePower(c)));
-      
-      // Check if any enemy has this power
-      return enemyCards.some(c => getEffectivePower(c) === highestPower);
-    }
-    
-    case 'CONDITIONAL_LOSING_LOCATION': {
-      // Player is currently losing this location (enemy has more power)
-      const allyPower = getTotalPower(location, sourcePlayer);
-      const enemyPower = getTotalPower(location, enemyPlayer);
-      return enemyPower > allyPower;
-    }
-    
-    // =======================================================================
-    // Game History Conditions
-    // =======================================================================
-    case 'CONDITIONAL_MOVED_BY_YOU_THIS_TURN': {
-      // Check if a card was moved by this player this turn
-      return state.cardsMovedThisTurn.length > 0;
-    }
-    
-    case 'CONDITIONAL_DESTROYED_THIS_GAME': {
-      // Check if any card has been destroyed this game
-      return state.cardsDestroyedThisGame.length > 0;
-    }
-    
-    case 'CONDITIONAL_MOVED_THIS_GAME': {
-      // Check if any card has been moved this game
-      return state.cardsMovedThisGame.length > 0;
-    }
-    
-    // =======================================================================
-    // Card Property Conditions
-    // =======================================================================
-    case 'CONDITIONAL_CARD_HAS_BUFF_TAG': {
-      // Check if the source card has the 'Buff' tag
-      return sourceCard.cardDef.tags.includes('Buff');
-    }
-    
-    case 'CONDITIONAL_CARD_HAS_ONGOING': {
-      // Check if the source card has ONGOING ability type
-      return sourceCard.cardDef.abilityType === 'ONGOING';
-    }
-    
-    // =======================================================================
-    // Default (unknown condition)
-    // =======================================================================
-    default: {
-      // Log warning for unknown conditions in development
-      console.warn(`Unknown condition: ${condition}`);
-      return false;
-    }
+  const evaluator: ConditionEvaluator | undefined = CONDITION_EVALUATORS[condition];
+  if (!evaluator) {
+    // Log warning for unknown conditions in development
+    console.warn(`Unknown condition: ${condition}`);
+    return false;
   }
+  return evaluator(state, sourceCard, getLocation(state, sourceLocation));
 }
 
 // =============================================================================
@@ -196,7 +179,7 @@ export function evaluateTargetCondition(
       return targetCard.cardDef.abilityType === 'ONGOING';
     
     case 'CONDITIONAL_ENEMY_HIGHEST_POWER_HERE': {
-      const enemyPlayer = (1 - sourceCard.owner) as PlayerId;
+      const enemyPlayer = getOpponentId(sourceCard.owner);
       const location = getLocation(state, sourceLocation);
       const enemyCards = getCards(location, enemyPlayer);
       
@@ -244,29 +227,29 @@ export function evaluateAnyCondition(
 // Condition Description Helpers (for debugging/logging)
 // =============================================================================
 
+const CONDITION_DESCRIPTIONS: Record<Condition, string> = {
+  'NONE': 'Always',
+  'CONDITIONAL_EXACTLY_ONE_OTHER_ALLY_HERE': 'If exactly 1 other ally here',
+  'CONDITIONAL_EXACTLY_TWO_ALLIES_HERE': 'If exactly 2 allies here',
+  'CONDITIONAL_ONLY_CARD_HERE': 'If only card here',
+  'CONDITIONAL_LOCATION_FULL': 'If location is full',
+  'CONDITIONAL_EMPTY_SLOT_HERE': 'If has empty slot here',
+  'CONDITIONAL_ENEMY_MORE_CARDS_HERE': 'If enemy has more cards here',
+  'CONDITIONAL_ENEMY_3PLUS_HERE': 'If enemy has 3+ cards here',
+  'CONDITIONAL_ENEMY_HIGHEST_POWER_HERE': 'If enemy has highest power here',
+  'CONDITIONAL_LOSING_LOCATION': 'If losing this location',
+  'CONDITIONAL_MOVED_BY_YOU_THIS_TURN': 'If moved a card this turn',
+  'CONDITIONAL_DESTROYED_THIS_GAME': 'If destroyed a card this game',
+  'CONDITIONAL_MOVED_THIS_GAME': 'If moved a card this game',
+  'CONDITIONAL_CARD_HAS_BUFF_TAG': 'If card has Buff tag',
+  'CONDITIONAL_CARD_HAS_ONGOING': 'If card has Ongoing ability',
+};
+
 /**
  * Get a human-readable description of a condition.
  */
 export function describeCondition(condition: Condition): string {
-  const descriptions: Record<Condition, string> = {
-    'NONE': 'Always',
-    'CONDITIONAL_EXACTLY_ONE_OTHER_ALLY_HERE': 'If exactly 1 other ally here',
-    'CONDITIONAL_EXACTLY_TWO_ALLIES_HERE': 'If exactly 2 allies here',
-    'CONDITIONAL_ONLY_CARD_HERE': 'If only card here',
-    'CONDITIONAL_LOCATION_FULL': 'If location is full',
-    'CONDITIONAL_EMPTY_SLOT_HERE': 'If has empty slot here',
-    'CONDITIONAL_ENEMY_MORE_CARDS_HERE': 'If enemy has more cards here',
-    'CONDITIONAL_ENEMY_3PLUS_HERE': 'If enemy has 3+ cards here',
-    'CONDITIONAL_ENEMY_HIGHEST_POWER_HERE': 'If enemy has highest power here',
-    'CONDITIONAL_LOSING_LOCATION': 'If losing this location',
-    'CONDITIONAL_MOVED_BY_YOU_THIS_TURN': 'If moved a card this turn',
-    'CONDITIONAL_DESTROYED_THIS_GAME': 'If destroyed a card this game',
-    'CONDITIONAL_MOVED_THIS_GAME': 'If moved a card this game',
-    'CONDITIONAL_CARD_HAS_BUFF_TAG': 'If card has Buff tag',
-    'CONDITIONAL_CARD_HAS_ONGOING': 'If card has Ongoing ability',
-  };
-  
-  return descriptions[condition] ?? `Unknown condition: ${condition}`;
+  return CONDITION_DESCRIPTIONS[condition] ?? `Unknown condition: ${condition}`;
 }
 
 // =============================================================================
@@ -297,7 +280,7 @@ export function createConditionSnapshot(
   sourceLocation: LocationIndex
 ): ConditionSnapshot {
   const sourcePlayer = sourceCard.owner;
-  const enemyPlayer = (1 - sourcePlayer) as PlayerId;
+  const enemyPlayer = getOpponentId(sourcePlayer);
   const location = getLocation(state, sourceLocation);
   
   return {
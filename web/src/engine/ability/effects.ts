@@ -8,7 +8,7 @@
  * Same inputs MUST produce identical outputs.
  */
 
-import type { GameState, CardInstance } from '../models';
+import type { GameState, CardInstance, LocationState } from '../models';
 import type { GameEvent } from '../events';
 import type { LocationIndex, PlayerId, InstanceId, Power } from '../types';
 import type { EffectType } from './types';
@@ -19,21 +19,23 @@ import {
   withLocation,
   getCardCount,
   getCards,
-  updateCard,
   removeCard,
   addCard,
-  addPermanentPower,
-  withOngoingPower,
+  addCardPermanentPower,
+  addCardPermanentPowerAt,
+  addCardOngoingPowerAt,
+  withLocations,
   getEffectivePower,
-  findCardByInstance,
   findCardLocation,
+  locateCard,
   withCardDestroyed,
+  withCardsDestroyed,
   withCardMoved,
-  withSilencedCard,
+  withSilencedCards,
   addBonusEnergyNextTurn,
   withNextInstanceId,
 } from '../models';
-import { LOCATION_CAPACITY } from '../types';
+import { ALL_LOCATIONS, LOCATION_CAPACITY, getOpponentId } from '../types';
 import { getCardDef } from '../cards';
 import { findMoveDestination, findAllyToMoveHere } from './selectors';
 
@@ -52,6 +54,11 @@ export interface EffectResult {
   readonly failureReason?: string;
 }
 
+/** Result of a move, including where the card ended up when it succeeded */
+interface MoveResult extends EffectResult {
+  readonly toLocation?: LocationIndex;
+}
+
 // =============================================================================
 // Core Effect Application
 // =============================================================================
@@ -62,14 +69,15 @@ export interface EffectResult {
  * @param state - Current game state
  * @param step - The timeline step to apply
  * @param rng - Seeded RNG for any random elements
+ * @param events - Optional list to append events to (defaults to a new one)
  * @returns New state, events, and success status
  */
 export function applyEffect(
   state: GameState,
   step: Step,
-  rng: SeededRNG
+  rng: SeededRNG,
+  events: GameEvent[] = []
 ): EffectResult {
-  const events: GameEvent[] = [];
   let newState = state;
   
   // Find the source card if it's a card effect
@@ -77,10 +85,9 @@ export function applyEffect(
   let sourceLocation: LocationIndex | null = null;
   
   if (step.source.type === 'CARD') {
-    sourceCard = findCardByInstance(state, step.source.id as InstanceId);
-    sourceLocation = findCardLocation(state, step.source.id as InstanceId);
+    const source = locateCard(state, step.source.id as InstanceId);
     
-    if (!sourceCard || sourceLocation === null) {
+    if (!source) {
       return {
         state,
         events: [],
@@ -88,6 +95,9 @@ export function applyEffect(
         failureReason: 'Source card not found',
       };
     }
+    
+    sourceCard = source.card;
+    sourceLocation = source.location;
   }
   
   // Apply based on effect type
@@ -197,13 +207,7 @@ export function applyEffect(
     
     case 'DESTROY_ONE_OTHER_ALLY_HERE':
     case 'DESTROY_ONE_ENEMY_HERE': {
-      for (const targetId of step.targets) {
-        const targetLoc = findCardLocation(newState, targetId);
-        if (targetLoc !== null) {
-          const result = applyDestroyEffect(newState, targetId, targetLoc, events, sourceCard?.instanceId);
-          newState = result.state;
-        }
-      }
+      newState = applyDestroyAll(newState, step.targets, events, sourceCard?.instanceId);
       break;
     }
     
@@ -235,9 +239,7 @@ export function applyEffect(
     // Ability Control Effects
     // =======================================================================
     case 'SILENCE_ENEMY_ONGOING_HERE': {
-      for (const targetId of step.targets) {
-        newState = withSilencedCard(newState, targetId);
-      }
+      newState = withSilencedCards(newState, step.targets);
       break;
     }
     
@@ -282,7 +284,7 @@ export function applyEffect(
               buffTargetIds = [sourceCard.instanceId];
             } else if (secondaryTarget === 'ONE_ALLY_OTHER_LOCATION') {
               // Find an ally at another location
-              const otherLocations = ([0, 1, 2] as LocationIndex[]).filter(idx => idx !== sourceLocation);
+              const otherLocations = ALL_LOCATIONS.filter(idx => idx !== sourceLocation);
               for (const locIdx of otherLocations) {
                 const loc = getLocation(newState, locIdx);
                 const allies = getCards(loc, sourceCard.owner);
@@ -293,7 +295,7 @@ export function applyEffect(
               }
             } else if (secondaryTarget === 'ONE_ENEMY_HERE') {
               // Find an enemy at this location
-              const enemyPlayer = (1 - sourceCard.owner) as PlayerId;
+              const enemyPlayer = getOpponentId(sourceCard.owner);
               const loc = getLocation(newState, sourceLocation);
               const enemies = getCards(loc, enemyPlayer);
               if (enemies.length > 0) {
@@ -317,13 +319,12 @@ export function applyEffect(
       // Otherwise, buff by step.value (Kronos/Moira Atropos)
       if (step.targets.length > 0 && sourceCard && sourceLocation !== null) {
         const targetId = step.targets[0]!;
-        const targetLoc = findCardLocation(newState, targetId);
-        if (targetLoc !== null) {
+        const target = locateCard(newState, targetId);
+        if (target) {
           // Capture target's power before destruction if we need to gain it
-          const target = findCardByInstance(newState, targetId);
-          const targetPower = target ? getEffectivePower(target) : 0;
+          const targetPower = getEffectivePower(target.card);
           
-          const destroyResult = applyDestroyEffect(newState, targetId, targetLoc, events, sourceCard.instanceId);
+          const destroyResult = applyDestroyEffect(newState, targetId, target.location, events, sourceCard.instanceId);
           newState = destroyResult.state;
           
           // Only buff self if destroy succeeded
@@ -388,12 +389,12 @@ export function applyEffect(
         
         // Only debuff if move succeeded
         if (moveResult.success) {
-          // Find the destination location by locating the moved card
-          const newCardLocation = findCardLocation(newState, sourceCard.instanceId);
+          // The move reports where the card landed; no need to search for it
+          const newCardLocation = moveResult.toLocation;
           
-          if (newCardLocation !== null && newCardLocation !== sourceLocation) {
+          if (newCardLocation !== undefined && newCardLocation !== sourceLocation) {
             // Find enemies at the destination
-            const enemyPlayer = (1 - sourceCard.owner) as PlayerId;
+            const enemyPlayer = getOpponentId(sourceCard.owner);
             const destLoc = getLocation(newState, newCardLocation);
             const enemies = getCards(destLoc, enemyPlayer);
             
@@ -462,58 +463,61 @@ function applyPowerModification(
   sourceCardId: InstanceId | undefined,
   events: GameEvent[]
 ): { state: GameState } {
-  let newState = state;
+  // A zero change would only emit no-op PowerChanged events
+  if (amount === 0) return { state };
+  
+  // Update a scratch copy of the locations and write them back once,
+  // instead of creating a new GameState per target
+  const locations: [LocationState, LocationState, LocationState] = [...state.locations] as [LocationState, LocationState, LocationState];
   
   for (const targetId of targetIds) {
-    const target = findCardByInstance(newState, targetId);
-    const targetLoc = findCardLocation(newState, targetId);
-    
-    if (!target || targetLoc === null) continue;
-    
-    const oldPower = getEffectivePower(target);
-    const updated = addPermanentPower(target, amount);
-    const newPower = getEffectivePower(updated);
-    
-    let loc = getLocation(newState, targetLoc);
-    loc = updateCard(loc, updated);
-    newState = withLocation(newState, targetLoc, loc);
-    
-    events.push({
-      type: 'PowerChanged',
-      cardInstanceId: targetId,
-      oldPower,
-      newPower,
-      sourceCardId: sourceCardId ?? targetId,
-    });
+    for (const locIdx of ALL_LOCATIONS) {
+      const result = addCardPermanentPowerAt(locations[locIdx], targetId, amount);
+      if (!result) continue;
+      locations[locIdx] = result.location;
+      
+      events.push({
+        type: 'PowerChanged',
+        cardInstanceId: targetId,
+        oldPower: result.oldPower,
+        newPower: result.newPower,
+        sourceCardId: sourceCardId ?? targetId,
+      });
+      break;
+    }
   }
   
-  return { state: newState };
+  return { state: withLocations(state, locations) };
 }
 
 /**
  * Apply ongoing power modification (temporary, recomputed each turn).
+ * 
+ * @param cardLocations - Optional precomputed InstanceId -> location index.
+ *   Ongoing recalculation never moves cards, so it builds this once and
+ *   passes it to every call instead of scanning the board per target.
  */
 export function applyOngoingPowerModification(
   state: GameState,
   targetIds: readonly InstanceId[],
-  amount: Power
+  amount: Power,
+  cardLocations?: ReadonlyMap<InstanceId, LocationIndex>
 ): GameState {
-  let newState = state;
+  if (amount === 0) return state;
+  
+  // Same scratch-locations pattern as applyPowerModification: one GameState
+  // per call rather than one per target
+  const locations: [LocationState, LocationState, LocationState] = [...state.locations] as [LocationState, LocationState, LocationState];
   
   for (const targetId of targetIds) {
-    const target = findCardByInstance(newState, targetId);
-    const targetLoc = findCardLocation(newState, targetId);
-    
-    if (!target || targetLoc === null) continue;
+    const locIdx = cardLocations?.get(targetId) ?? findCardLocation(state, targetId);
+    if (locIdx === null) continue;
     
-    const updated = withOngoingPower(target, target.ongoingPowerModifier + amount);
-    
-    let loc = getLocation(newState, targetLoc);
-    loc = updateCard(loc, updated);
-    newState = withLocation(newState, targetLoc, loc);
+    const loc = addCardOngoingPowerAt(locations[locIdx], targetId, amount);
+    if (loc) locations[locIdx] = loc;
   }
   
-  return newState;
+  return withLocations(state, locations);
 }
 
 /**
@@ -526,8 +530,8 @@ function applyMoveEffect(
   rng: SeededRNG,
   events: GameEvent[],
   sourceCardId?: InstanceId
-): EffectResult {
-  const card = findCardByInstance(state, cardId);
+): MoveResult {
+  const card = locateCard(state, cardId)?.card;
   if (!card) {
     return { state, events: [], success: false, failureReason: 'Card not found' };
   }
@@ -551,25 +555,18 @@ function applyMoveToLocation(
   toLocation: LocationIndex,
   events: GameEvent[],
   sourceCardId?: InstanceId
-): EffectResult {
-  let newState = state;
-  
+): MoveResult {
   // Remove from source
-  const sourceLoc = getLocation(newState, fromLocation);
-  const [newSourceLoc, removedCard] = removeCard(sourceLoc, cardId);
+  const [newSourceLoc, removedCard] = removeCard(getLocation(state, fromLocation), cardId);
   if (!removedCard) {
     return { state, events: [], success: false, failureReason: 'Failed to remove card' };
   }
   
-  newState = withLocation(newState, fromLocation, newSourceLoc);
-  
-  // Add to destination
-  let destLoc = getLocation(newState, toLocation);
-  destLoc = addCard(destLoc, removedCard, removedCard.owner);
-  newState = withLocation(newState, toLocation, destLoc);
-  
-  // Track move
-  newState = withCardMoved(newState, cardId);
+  // Add to destination and commit both locations together
+  const locations: [LocationState, LocationState, LocationState] = [...state.locations] as [LocationState, LocationState, LocationState];
+  locations[fromLocation] = newSourceLoc;
+  locations[toLocation] = addCard(locations[toLocation], removedCard, removedCard.owner);
+  const newState = withCardMoved(withLocations(state, locations), cardId);
   
   events.push({
     type: 'CardMoved',
@@ -579,7 +576,7 @@ function applyMoveToLocation(
     sourceCardId: sourceCardId ?? cardId,
   });
   
-  return { state: newState, events, success: true };
+  return { state: newState, events, success: true, toLocation };
 }
 
 /**
@@ -614,6 +611,39 @@ function applyDestroyEffect(
   return { state: newState, events, success: true };
 }
 
+/**
+ * Destroy every target that is on the board, with a single state update.
+ */
+function applyDestroyAll(
+  state: GameState,
+  targetIds: readonly InstanceId[],
+  events: GameEvent[],
+  sourceCardId?: InstanceId
+): GameState {
+  const locations: [LocationState, LocationState, LocationState] = [...state.locations] as [LocationState, LocationState, LocationState];
+  const destroyedIds: InstanceId[] = [];
+  
+  for (const targetId of targetIds) {
+    for (const locIdx of ALL_LOCATIONS) {
+      const [newLoc, removed] = removeCard(locations[locIdx], targetId);
+      if (!removed) continue;
+      
+      locations[locIdx] = newLoc;
+      destroyedIds.push(targetId);
+      events.push({
+        type: 'CardDestroyed',
+        cardInstanceId: targetId,
+        location: locIdx,
+        sourceCardId: sourceCardId ?? targetId,
+      });
+      break;
+    }
+  }
+  
+  if (destroyedIds.length === 0) return state;
+  return withCardsDestroyed(withLocations(state, locations), destroyedIds);
+}
+
 /**
  * Apply a steal power effect.
  */
@@ -624,48 +654,34 @@ function applyStealPower(
   amount: Power,
   events: GameEvent[]
 ): { state: GameState } {
+  if (amount === 0) return { state };
+  
   let newState = state;
   
   // Debuff target
-  const target = findCardByInstance(newState, targetId);
-  const targetLoc = findCardLocation(newState, targetId);
+  const targetResult = addCardPermanentPower(newState, targetId, -amount);
   
-  if (target && targetLoc !== null) {
-    const oldTargetPower = getEffectivePower(target);
-    const updatedTarget = addPermanentPower(target, -amount);
-    const newTargetPower = getEffectivePower(updatedTarget);
-    
-    let loc = getLocation(newState, targetLoc);
-    loc = updateCard(loc, updatedTarget);
-    newState = withLocation(newState, targetLoc, loc);
-    
+  if (targetResult) {
+    newState = targetResult.state;
     events.push({
       type: 'PowerChanged',
       cardInstanceId: targetId,
-      oldPower: oldTargetPower,
-      newPower: newTargetPower,
+      oldPower: targetResult.oldPower,
+      newPower: targetResult.newPower,
       sourceCardId: stealerId,
     });
   }
   
   // Buff stealer
-  const stealer = findCardByInstance(newState, stealerId);
-  const stealerLoc = findCardLocation(newState, stealerId);
+  const stealerResult = addCardPermanentPower(newState, stealerId, amount);
   
-  if (stealer && stealerLoc !== null) {
-    const oldStealerPower = getEffectivePower(stealer);
-    const updatedStealer = addPermanentPower(stealer, amount);
-    const newStealerPower = getEffectivePower(updatedStealer);
-    
-    let loc = getLocation(newState, stealerLoc);
-    loc = updateCard(loc, updatedStealer);
-    newState = withLocation(newState, stealerLoc, loc);
-    
+  if (stealerResult) {
+    newState = stealerResult.state;
     events.push({
       type: 'PowerChanged',
       cardInstanceId: stealerId,
-      oldPower: oldStealerPower,
-      newPower: newStealerPower,
+      oldPower: stealerResult.oldPower,
+      newPower: stealerResult.newPower,
       sourceCardId: stealerId,
     });
   }
@@ -673,6 +689,9 @@ function applyStealPower(
   return { state: newState };
 }
 
+/** Card summoned by SUMMON_SPIRIT, looked up once at module load */
+const SHADE_DEF = getCardDef('shade');
+
 /**
  * Apply a summon effect.
  */
@@ -690,9 +709,7 @@ function applySummonEffect(
     return { state: newState };
   }
   
-  // Get spirit definition
-  const spiritDef = getCardDef('shade');
-  if (!spiritDef) {
+  if (!SHADE_DEF) {
     return { state: newState };
   }
   
@@ -703,9 +720,9 @@ function applySummonEffect(
   // Create spirit instance
   const spirit: CardInstance = {
     instanceId: newState.nextInstanceId,
-    cardDef: spiritDef,
+    cardDef: SHADE_DEF,
     owner,
-    permanentPowerModifier: spiritPower - spiritDef.basePower,
+    permanentPowerModifier: spiritPower - SHADE_DEF.basePower,
     ongoingPowerModifier: 0,
     revealed: true,
   };
@@ -722,42 +739,42 @@ function applySummonEffect(
 // Effect Description (for debugging)
 // =============================================================================
 
+const EFFECT_TYPE_DESCRIPTIONS: Record<EffectType, string> = {
+  'POWER': 'modify power',
+  'SELF_BUFF': 'buff self',
+  'BUFF_OTHER_ALLY_HERE': 'buff one ally here',
+  'BUFF_ALLIES_HERE': 'buff all allies here',
+  'BUFF_ALLIES_HERE_EXCEPT_SELF': 'buff other allies here',
+  'BUFF_ALLIES_OTHER_LOCATIONS': 'buff allies elsewhere',
+  'BUFF_ONE_ALLY_OTHER_LOCATION': 'buff one ally elsewhere',
+  'BUFF_ALLIES_HERE_PER_EMPTY_SLOT': 'buff per empty slot',
+  'DEBUFF_ONE_ENEMY_HERE': 'debuff one enemy here',
+  'DEBUFF_ENEMIES_HERE': 'debuff all enemies here',
+  'DEBUFF_ENEMY_BUFF_TAGGED_HERE': 'debuff Buff-tagged enemies',
+  'DEBUFF_ENEMY_ONGOING_HERE': 'debuff Ongoing enemies',
+  'MOVE_SELF_TO_OTHER_LOCATION': 'move self',
+  'MOVE_ONE_OTHER_ALLY_TO_HERE': 'move ally here',
+  'MOVE_ONE_OTHER_ALLY_FROM_HERE_TO_OTHER_LOCATION': 'move ally away',
+  'MOVE_ONE_ENEMY_TO_OTHER_LOCATION': 'move enemy',
+  'DESTROY_SELF': 'destroy self',
+  'DESTROY_ONE_OTHER_ALLY_HERE': 'destroy one ally',
+  'DESTROY_ONE_ENEMY_HERE': 'destroy one enemy',
+  'GAIN_DESTROYED_CARD_POWER': 'gain power from destroyed',
+  'STEAL_POWER': 'steal power',
+  'SILENCE_ENEMY_ONGOING_HERE': 'silence enemies',
+  'PROTECT_ALLIES_FROM_DEBUFF': 'protect allies from debuffs',
+  'BUFF_DESTROY_CARDS_GLOBAL': 'buff Destroy cards',
+  'DESTROY_AND_BUFF': 'destroy then buff',
+  'DESTROY_AND_SELF_BUFF': 'destroy then self-buff',
+  'MOVE_AND_BUFF': 'move then buff',
+  'MOVE_SELF_AND_DEBUFF_DESTINATION': 'move self then debuff enemy',
+  'ADD_ENERGY_NEXT_TURN': 'add energy next turn',
+  'SUMMON_SPIRIT': 'summon spirit',
+};
+
 /**
  * Get a human-readable description of an effect type.
  */
 export function describeEffectType(effect: EffectType): string {
-  const descriptions: Record<EffectType, string> = {
-    'POWER': 'modify power',
-    'SELF_BUFF': 'buff self',
-    'BUFF_OTHER_ALLY_HERE': 'buff one ally here',
-    'BUFF_ALLIES_HERE': 'buff all allies here',
-    'BUFF_ALLIES_HERE_EXCEPT_SELF': 'buff other allies here',
-    'BUFF_ALLIES_OTHER_LOCATIONS': 'buff allies elsewhere',
-    'BUFF_ONE_ALLY_OTHER_LOCATION': 'buff one ally elsewhere',
-    'BUFF_ALLIES_HERE_PER_EMPTY_SLOT': 'buff per empty slot',
-    'DEBUFF_ONE_ENEMY_HERE': 'debuff one enemy here',
-    'DEBUFF_ENEMIES_HERE': 'debuff all enemies here',
-    'DEBUFF_ENEMY_BUFF_TAGGED_HERE': 'debuff Buff-tagged enemies',
-    'DEBUFF_ENEMY_ONGOING_HERE': 'debuff Ongoing enemies',
-    'MOVE_SELF_TO_OTHER_LOCATION': 'move self',
-    'MOVE_ONE_OTHER_ALLY_TO_HERE': 'move ally here',
-    'MOVE_ONE_OTHER_ALLY_FROM_HERE_TO_OTHER_LOCATION': 'move ally away',
-    'MOVE_ONE_ENEMY_TO_OTHER_LOCATION': 'move enemy',
-    'DESTROY_SELF': 'destroy self',
-    'DESTROY_ONE_OTHER_ALLY_HERE': 'destroy one ally',
-    'DESTROY_ONE_ENEMY_HERE': 'destroy one enemy',
-    'GAIN_DESTROYED_CARD_POWER': 'gain power from destroyed',
-    'STEAL_POWER': 'steal power',
-    'SILENCE_ENEMY_ONGOING_HERE': 'silence enemies',
-    'PROTECT_ALLIES_FROM_DEBUFF': 'protect allies from debuffs',
-    'BUFF_DESTROY_CARDS_GLOBAL': 'buff Destroy cards',
-    'DESTROY_AND_BUFF': 'destroy then buff',
-    'DESTROY_AND_SELF_BUFF': 'destroy then self-buff',
-    'MOVE_AND_BUFF': 'move then buff',
-    'MOVE_SELF_AND_DEBUFF_DESTINATION': 'move self then debuff enemy',
-    'ADD_ENERGY_NEXT_TURN': 'add energy next turn',
-    'SUMMON_SPIRIT': 'summon spirit',
-  };
-  
-  return descriptions[effect] ?? `unknown effect: ${effect}`;
+  return EFFECT_TYPE_DESCRIPTIONS[effect] ?? `unknown effect: ${effect}`;
 }
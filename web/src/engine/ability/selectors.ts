@@ -10,18 +10,18 @@
  * CRITICAL: Selectors are pure functions that NEVER mutate state.
  */
 
-import type { GameState, CardInstance } from '../models';
+import type { GameState, CardInstance, LocationState } from '../models';
 import type { LocationIndex, PlayerId, InstanceId } from '../types';
 import type { TargetSelector, Condition } from './types';
 import { SeededRNG } from '../rng';
 import {
   getLocation,
   getCards,
-  getAllCards,
+  locateCard,
   getEffectivePower,
   getCardCount,
 } from '../models';
-import { LOCATION_CAPACITY } from '../types';
+import { ALL_LOCATIONS, LOCATION_CAPACITY, getOpponentId } from '../types';
 import { evaluateTargetCondition } from './conditions';
 
 // =============================================================================
@@ -29,185 +29,205 @@ import { evaluateTargetCondition } from './conditions';
 // =============================================================================
 
 /**
- * Resolve targets for an ability based on the target selector.
- * 
- * @param selector - The target selector to use
- * @param state - Current game state
- * @param sourceCard - The card that owns the ability
- * @param sourceLocation - Location where the source card is
- * @param rng - Seeded RNG for random selections
- * @returns Array of target instance IDs (can be empty if no valid targets)
+ * Resolves one selector for a source card. `location` is the source location's
+ * state, looked up once by the caller.
  */
-export function resolveTargets(
-  selector: TargetSelector,
+type TargetResolver = (
   state: GameState,
   sourceCard: CardInstance,
   sourceLocation: LocationIndex,
+  location: LocationState,
   rng: SeededRNG
-): readonly InstanceId[] {
-  const sourcePlayer = sourceCard.owner;
-  const enemyPlayer = (1 - sourcePlayer) as PlayerId;
-  const location = getLocation(state, sourceLocation);
+) => readonly InstanceId[];
+
+/**
+ * One resolver per selector, built once at module load so resolution is a
+ * table lookup plus a direct call.
+ */
+const TARGET_RESOLVERS: Record<TargetSelector, TargetResolver> = {
+  // =======================================================================
+  // Self
+  // =======================================================================
+  'SELF': (_state, sourceCard) => [sourceCard.instanceId],
   
-  switch (selector) {
-    // =======================================================================
-    // Self
-    // =======================================================================
-    case 'SELF':
-      return [sourceCard.instanceId];
-    
-    // =======================================================================
-    // Allies at Same Location
-    // =======================================================================
-    case 'ONE_OTHER_ALLY_HERE': {
-      const allies = getCards(location, sourcePlayer)
-        .filter(c => c.instanceId !== sourceCard.instanceId);
-      const selected = selectOne(allies, 'FIRST');
-      return selected ? [selected.instanceId] : [];
-    }
-    
-    case 'ALL_ALLIES_HERE': {
-      const allies = getCards(location, sourcePlayer);
-      return sortByDeterministicOrder(allies).map(c => c.instanceId);
-    }
-    
-    case 'ALL_ALLIES_HERE_EXCEPT_SELF': {
-      const allies = getCards(location, sourcePlayer)
-        .filter(c => c.instanceId !== sourceCard.instanceId);
-      return sortByDeterministicOrder(allies).map(c => c.instanceId);
-    }
-    
-    // =======================================================================
-    // Enemies at Same Location
-    // =======================================================================
-    case 'ONE_ENEMY_HERE': {
-      const enemies = getCards(location, enemyPlayer);
-      const selected = selectOne(enemies, 'FIRST');
-      return selected ? [selected.instanceId] : [];
-    }
-    
-    case 'ALL_ENEMIES_HERE': {
-      const enemies = getCards(location, enemyPlayer);
-      return sortByDeterministicOrder(enemies).map(c => c.instanceId);
-    }
-    
-    case 'HIGHEST_POWER_ENEMY_HERE': {
-      const enemies = getCards(location, enemyPlayer);
-      const selected = selectOne(enemies, 'HIGHEST_POWER');
-      return selected ? [selected.instanceId] : [];
+  // =======================================================================
+  // Allies at Same Location
+  // =======================================================================
+  'ONE_OTHER_ALLY_HERE': (_state, sourceCard, _sourceLocation, location) => {
+    const sourceId = sourceCard.instanceId;
+    const allies = getCards(location, sourceCard.owner)
+      .filter(c => c.instanceId !== sourceId);
+    const selected = selectOne(allies, 'FIRST');
+    return selected ? [selected.instanceId] : [];
+  },
+  
+  'ALL_ALLIES_HERE': (_state, sourceCard, _sourceLocation, location) => {
+    const allies = getCards(location, sourceCard.owner);
+    return sortedInstanceIds(allies);
+  },
+  
+  'ALL_ALLIES_HERE_EXCEPT_SELF': (_state, sourceCard, _sourceLocation, location) => {
+    const sourceId = sourceCard.instanceId;
+    const allies = getCards(location, sourceCard.owner)
+      .filter(c => c.instanceId !== sourceId);
+    return sortedInstanceIds(allies);
+  },
+  
+  // =======================================================================
+  // Enemies at Same Location
+  // =======================================================================
+  'ONE_ENEMY_HERE': (_state, sourceCard, _sourceLocation, location) => {
+    const enemies = getCards(location, getOpponentId(sourceCard.owner));
+    const selected = selectOne(enemies, 'FIRST');
+    return selected ? [selected.instanceId] : [];
+  },
+  
+  'ALL_ENEMIES_HERE': (_state, sourceCard, _sourceLocation, location) => {
+    const enemies = getCards(location, getOpponentId(sourceCard.owner));
+    return sortedInstanceIds(enemies);
+  },
+  
+  'HIGHEST_POWER_ENEMY_HERE': (_state, sourceCard, _sourceLocation, location) => {
+    const enemies = getCards(location, getOpponentId(sourceCard.owner));
+    const selected = selectOne(enemies, 'HIGHEST_POWER');
+    return selected ? [selected.instanceId] : [];
+  },
+  
+  'LOWEST_POWER_ENEMY_HERE': (_state, sourceCard, _sourceLocation, location) => {
+    const enemies = getCards(location, getOpponentId(sourceCard.owner));
+    const selected = selectOne(enemies, 'LOWEST_POWER');
+    return selected ? [selected.instanceId] : [];
+  },
+  
+  // =======================================================================
+  // Other Locations
+  // =======================================================================
+  'ONE_ALLY_OTHER_LOCATION': (state, sourceCard, sourceLocation) => {
+    for (const locIdx of ALL_LOCATIONS) {
+      if (locIdx === sourceLocation) continue;
+      const loc = getLocation(state, locIdx);
+      const allies = getCards(loc, sourceCard.owner);
+      if (allies.length > 0) {
+        const selected = selectOne(allies, 'FIRST');
+        return selected ? [selected.instanceId] : [];
+      }
     }
-    
-    case 'LOWEST_POWER_ENEMY_HERE': {
-      const enemies = getCards(location, enemyPlayer);
-      const selected = selectOne(enemies, 'LOWEST_POWER');
-      return selected ? [selected.instanceId] : [];
+    return [];
+  },
+  
+  'ALL_ALLIES_OTHER_LOCATIONS': (state, sourceCard, sourceLocation) => {
+    const result: CardInstance[] = [];
+    for (const locIdx of ALL_LOCATIONS) {
+      if (locIdx === sourceLocation) continue;
+      const loc = getLocation(state, locIdx);
+      result.push(...getCards(loc, sourceCard.owner));
     }
-    
-    // =======================================================================
-    // Other Locations
-    // =======================================================================
-    case 'ONE_ALLY_OTHER_LOCATION': {
-      const otherLocations = ([0, 1, 2] as LocationIndex[])
-        .filter(idx => idx !== sourceLocation);
-      
-      for (const locIdx of otherLocations) {
-        const loc = getLocation(state, locIdx);
-        const allies = getCards(loc, sourcePlayer);
-        if (allies.length > 0) {
-          const selected = selectOne(allies, 'FIRST');
-          return selected ? [selected.instanceId] : [];
+    return sortedInstanceIds(result);
+  },
+  
+  // This is typically used after a move - find first enemy at destination
+  // For now, return empty; actual destination determined at execution time
+  'ONE_ENEMY_AT_DESTINATION': () => [],
+  
+  // =======================================================================
+  // Location Target
+  // =======================================================================
+  // Return location index as the "target" (special case)
+  // The effect will interpret this as targeting the location itself
+  'LOCATION': (_state, _sourceCard, sourceLocation) => [sourceLocation as unknown as InstanceId],
+  
+  // =======================================================================
+  // Random Target
+  // =======================================================================
+  'RANDOM_VALID_TARGET': (state, sourceCard, _sourceLocation, _location, rng) => {
+    // Get all valid targets (all cards except self), in board order
+    const sourceId = sourceCard.instanceId;
+    const validTargets: CardInstance[] = [];
+    for (const loc of state.locations) {
+      for (const cards of loc.cardsByPlayer) {
+        for (const c of cards) {
+          if (c.instanceId !== sourceId) validTargets.push(c);
         }
       }
-      return [];
-    }
-    
-    case 'ALL_ALLIES_OTHER_LOCATIONS': {
-      const otherLocations = ([0, 1, 2] as LocationIndex[])
-        .filter(idx => idx !== sourceLocation);
-      
-      const result: CardInstance[] = [];
-      for (const locIdx of otherLocations) {
-        const loc = getLocation(state, locIdx);
-        result.push(...getCards(loc, sourcePlayer));
-      }
-      return sortByDeterministicOrder(result).map(c => c.instanceId);
     }
     
-    case 'ONE_ENEMY_AT_DESTINATION': {
-      // This is typically used after a move - find first enemy at destination
-      // For now, return empty; actual destination determined at execution time
-      return [];
-    }
-    
-    // =======================================================================
-    // Location Target
-    // =======================================================================
-    case 'LOCATION':
-      // Return location index as the "target" (special case)
-      // The effect will interpret this as targeting the location itself
-      return [sourceLocation as unknown as InstanceId];
+    if (validTargets.length === 0) return [];
     
-    // =======================================================================
-    // Random Target
-    // =======================================================================
-    case 'RANDOM_VALID_TARGET': {
-      // Get all valid targets (all cards except self)
-      const allCards: CardInstance[] = [];
-      for (const loc of state.locations) {
-        allCards.push(...getAllCards(loc));
-      }
-      const validTargets = allCards.filter(c => c.instanceId !== sourceCard.instanceId);
-      
-      if (validTargets.length === 0) return [];
-      
-      const selected = rng.pick(validTargets);
-      return selected ? [selected.instanceId] : [];
-    }
-    
-    // =======================================================================
-    // Special Filters
-    // =======================================================================
-    case 'FRIENDLY_WITH_DESTROY_TAG': {
-      const allAllies: CardInstance[] = [];
-      for (const loc of state.locations) {
-        const allies = getCards(loc, sourcePlayer);
-        for (const ally of allies) {
-          if (ally.cardDef.tags.includes('Destroy')) {
-            allAllies.push(ally);
-          }
+    const selected = rng.pick(validTargets);
+    return selected ? [selected.instanceId] : [];
+  },
+  
+  // =======================================================================
+  // Special Filters
+  // =======================================================================
+  'FRIENDLY_WITH_DESTROY_TAG': (state, sourceCard) => {
+    const allAllies: CardInstance[] = [];
+    for (const loc of state.locations) {
+      const allies = getCards(loc, sourceCard.owner);
+      for (const ally of allies) {
+        if (ally.cardDef.tags.includes('Destroy')) {
+          allAllies.push(ally);
         }
       }
-      return sortByDeterministicOrder(allAllies).map(c => c.instanceId);
-    }
-    
-    case 'ENEMY_WITH_BUFF_TAG_HERE': {
-      const enemies = getCards(location, enemyPlayer)
-        .filter(c => c.cardDef.tags.includes('Buff'));
-      return sortByDeterministicOrder(enemies).map(c => c.instanceId);
-    }
-    
-    case 'ENEMY_WITH_ONGOING_HERE': {
-      const enemies = getCards(location, enemyPlayer)
-        .filter(c => c.cardDef.abilityType === 'ONGOING');
-      return sortByDeterministicOrder(enemies).map(c => c.instanceId);
-    }
-    
-    case 'ALLIES_HERE_ARMY_EXCEPT_SELF': {
-      // Allied cards with 'Army' type at this location, except self
-      // Used by Kouretes: +1 to other Army cards here
-      const allies = getCards(location, sourcePlayer)
-        .filter(c => c.instanceId !== sourceCard.instanceId && c.cardDef.cardType === 'Army');
-      return sortByDeterministicOrder(allies).map(c => c.instanceId);
-    }
-    
-    // =======================================================================
-    // Default (unknown selector)
-    // =======================================================================
-    default: {
-      console.warn(`Unknown target selector: ${selector}`);
-      return [];
     }
+    return sortedInstanceIds(allAllies);
+  },
+  
+  'ENEMY_WITH_BUFF_TAG_HERE': (_state, sourceCard, _sourceLocation, location) => {
+    const enemies = getCards(location, getOpponentId(sourceCard.owner))
+      .filter(c => c.cardDef.tags.includes('Buff'));
+    return sortedInstanceIds(enemies);
+  },
+  
+  'ENEMY_WITH_ONGOING_HERE': (_state, sourceCard, _sourceLocation, location) => {
+    const enemies = getCards(location, getOpponentId(sourceCard.owner))
+      .filter(c => c.cardDef.abilityType === 'ONGOING');
+    return sortedInstanceIds(enemies);
+  },
+  
+  // Allied cards with 'Army' type at this location, except self
+  // Used by Kouretes: +1 to other Army cards here
+  'ALLIES_HERE_ARMY_EXCEPT_SELF': (_state, sourceCard, _sourceLocation, location) => {
+    const sourceId = sourceCard.instanceId;
+    const allies = getCards(location, sourceCard.owner)
+      .filter(c => c.instanceId !== sourceId && c.cardDef.cardType === 'Army');
+    return sortedInstanceIds(allies);
+  },
+  
+  // =======================================================================
+  // Compound Effect Markers
+  // =======================================================================
+  // Resolved by the compound effect itself; reaching here is a bug, so warn
+  // the same way as an unknown selector
+  'MOVED_CARD': () => {
+    console.warn('Unknown target selector: MOVED_CARD');
+    return [];
+  },
+};
+
+/**
+ * Resolve targets for an ability based on the target selector.
+ * 
+ * @param selector - The target selector to use
+ * @param state - Current game state
+ * @param sourceCard - The card that owns the ability
+ * @param sourceLocation - Location where the source card is
+ * @param rng - Seeded RNG for random selections
+ * @returns Array of target instance IDs (can be empty if no valid targets)
+ */
+export function resolveTargets(
+  selector: TargetSelector,
+  state: GameState,
+  sourceCard: CardInstance,
+  sourceLocation: LocationIndex,
+  rng: SeededRNG
+): readonly InstanceId[] {
+  const resolver: TargetResolver | undefined = TARGET_RESOLVERS[selector];
+  if (!resolver) {
+    console.warn(`Unknown target selector: ${selector}`);
+    return [];
   }
+  return resolver(state, sourceCard, sourceLocation, getLocation(state, sourceLocation), rng);
 }
 
 // =============================================================================
@@ -218,6 +238,8 @@ type SelectionStrategy = 'FIRST' | 'HIGHEST_POWER' | 'LOWEST_POWER' | 'RANDOM';
 
 /**
  * Select one card from a list using a deterministic strategy.
+ * FIRST/HIGHEST_POWER/LOWEST_POWER are a single scan with instanceId
+ * tie-breaking; only RANDOM needs the full deterministic sort.
  */
 function selectOne(
   cards: readonly CardInstance[],
@@ -227,40 +249,43 @@ function selectOne(
   if (cards.length === 0) return null;
   if (cards.length === 1) return cards[0]!;
   
-  const sorted = sortByDeterministicOrder([...cards]);
-  
   switch (strategy) {
-    case 'FIRST':
-      return sorted[0]!;
+    case 'HIGHEST_POWER':
+      return scanBest(cards, (a, b) => getEffectivePower(a) - getEffectivePower(b));
     
-    case 'HIGHEST_POWER': {
-      let highest = sorted[0]!;
-      for (const card of sorted) {
-        if (getEffectivePower(card) > getEffectivePower(highest)) {
-          highest = card;
-        }
-      }
-      return highest;
-    }
-    
-    case 'LOWEST_POWER': {
-      let lowest = sorted[0]!;
-      for (const card of sorted) {
-        if (getEffectivePower(card) < getEffectivePower(lowest)) {
-          lowest = card;
-        }
-      }
-      return lowest;
-    }
+    case 'LOWEST_POWER':
+      return scanBest(cards, (a, b) => getEffectivePower(b) - getEffectivePower(a));
     
     case 'RANDOM': {
+      const sorted = sortByDeterministicOrder(cards);
       if (!rng) return sorted[0]!;
       return rng.pick(sorted) ?? sorted[0]!;
     }
     
+    case 'FIRST':
     default:
-      return sorted[0]!;
+      return scanBest(cards, () => 0);
+  }
+}
+
+/**
+ * Return the card that ranks highest under `compare`, breaking ties by the
+ * lower instanceId. Equivalent to sorting by instanceId and keeping the first
+ * strictly-better card, without allocating the sorted copy.
+ */
+function scanBest(
+  cards: readonly CardInstance[],
+  compare: (a: CardInstance, b: CardInstance) => number
+): CardInstance {
+  let best = cards[0]!;
+  for (let i = 1; i < cards.length; i++) {
+    const card = cards[i]!;
+    const diff = compare(card, best);
+    if (diff > 0 || (diff === 0 && card.instanceId < best.instanceId)) {
+      best = card;
+    }
   }
+  return best;
 }
 
 // =============================================================================
@@ -277,6 +302,15 @@ function sortByDeterministicOrder(cards: readonly CardInstance[]): CardInstance[
   return [...cards].sort((a, b) => a.instanceId - b.instanceId);
 }
 
+/**
+ * Instance ids of the given cards in deterministic order. Sorting the mapped
+ * id array in place gives the same order as sorting the cards, with one
+ * allocation instead of two.
+ */
+function sortedInstanceIds(cards: readonly CardInstance[]): InstanceId[] {
+  return cards.map(c => c.instanceId).sort((a, b) => a - b);
+}
+
 /**
  * Sort cards by power with deterministic tie-breaking.
  * @param ascending - If true, sort lowest to highest; otherwise highest to lowest
@@ -316,21 +350,10 @@ export function resolveTargetsWithCondition(
   const filteredIds: InstanceId[] = [];
   for (const targetId of targetIds) {
     // Find the target card
-    let targetCard: CardInstance | null = null;
-    let targetLocation: LocationIndex | null = null;
+    const target = locateCard(state, targetId);
     
-    for (const loc of state.locations) {
-      const allCards = getAllCards(loc);
-      const found = allCards.find(c => c.instanceId === targetId);
-      if (found) {
-        targetCard = found;
-        targetLocation = loc.index;
-        break;
-      }
-    }
-    
-    if (targetCard && targetLocation !== null) {
-      if (evaluateTargetCondition(condition, state, targetCard, targetLocation, sourceCard, sourceLocation)) {
+    if (target) {
+      if (evaluateTargetCondition(condition, state, target.card, target.location, sourceCard, sourceLocation)) {
         filteredIds.push(targetId);
       }
     }
@@ -350,10 +373,20 @@ export function findMoveDestination(
   strategy: 'FIRST_AVAILABLE' | 'RANDOM' | 'LEFTMOST' | 'RIGHTMOST' = 'FIRST_AVAILABLE',
   rng?: SeededRNG
 ): LocationIndex | null {
+  // First/leftmost only needs the first open location, no candidate list
+  if (strategy === 'FIRST_AVAILABLE' || strategy === 'LEFTMOST') {
+    for (const locIdx of ALL_LOCATIONS) {
+      if (locIdx !== sourceLocation && getCardCount(getLocation(state, locIdx), cardOwner) < LOCATION_CAPACITY) {
+        return locIdx;
+      }
+    }
+    return null;
+  }
+  
   const availableLocations: LocationIndex[] = [];
   
   // Check each location (in order: 0, 1, 2 for determinism)
-  for (const locIdx of [0, 1, 2] as LocationIndex[]) {
+  for (const locIdx of ALL_LOCATIONS) {
     if (locIdx === sourceLocation) continue;
     
     const loc = getLocation(state, locIdx);
@@ -365,10 +398,6 @@ export function findMoveDestination(
   if (availableLocations.length === 0) return null;
   
   switch (strategy) {
-    case 'FIRST_AVAILABLE':
-    case 'LEFTMOST':
-      return availableLocations[0]!;
-    
     case 'RIGHTMOST':
       return availableLocations[availableLocations.length - 1]!;
     
@@ -390,18 +419,17 @@ export function findAllyToMoveHere(
   targetLocation: LocationIndex,
   rng?: SeededRNG
 ): { cardId: InstanceId; fromLocation: LocationIndex } | null {
+  // Target location must have space; this does not depend on the source location
+  if (getCardCount(getLocation(state, targetLocation), player) >= LOCATION_CAPACITY) return null;
+  
   // Check other locations for allies
-  for (const locIdx of [0, 1, 2] as LocationIndex[]) {
+  for (const locIdx of ALL_LOCATIONS) {
     if (locIdx === targetLocation) continue;
     
     const loc = getLocation(state, locIdx);
     const allies = getCards(loc, player);
     
     if (allies.length > 0) {
-      // Check if target location has space
-      const targetLoc = getLocation(state, targetLocation);
-      if (getCardCount(targetLoc, player) >= LOCATION_CAPACITY) continue;
-      
       // Select one ally deterministically
       const selected = selectOne(allies, rng ? 'RANDOM' : 'FIRST', rng);
       if (selected) {
@@ -449,30 +477,30 @@ export function countPotentialTargets(
 // Target Selector Description (for debugging)
 // =============================================================================
 
+const TARGET_SELECTOR_DESCRIPTIONS: Record<TargetSelector, string> = {
+  'SELF': 'self',
+  'ONE_OTHER_ALLY_HERE': 'one other ally here',
+  'ALL_ALLIES_HERE': 'all allies here',
+  'ALL_ALLIES_HERE_EXCEPT_SELF': 'all other allies here',
+  'ONE_ENEMY_HERE': 'one enemy here',
+  'ALL_ENEMIES_HERE': 'all enemies here',
+  'HIGHEST_POWER_ENEMY_HERE': 'highest power enemy here',
+  'LOWEST_POWER_ENEMY_HERE': 'lowest power enemy here',
+  'ONE_ALLY_OTHER_LOCATION': 'one ally at another location',
+  'ALL_ALLIES_OTHER_LOCATIONS': 'all allies at other locations',
+  'ONE_ENEMY_AT_DESTINATION': 'one enemy at destination',
+  'LOCATION': 'this location',
+  'RANDOM_VALID_TARGET': 'random target',
+  'FRIENDLY_WITH_DESTROY_TAG': 'allies with Destroy tag',
+  'ENEMY_WITH_BUFF_TAG_HERE': 'enemies with Buff tag here',
+  'ENEMY_WITH_ONGOING_HERE': 'enemies with Ongoing abilities here',
+  'ALLIES_HERE_ARMY_EXCEPT_SELF': 'other Army allies here',
+  'MOVED_CARD': 'the moved card',
+};
+
 /**
  * Get a human-readable description of a target selector.
  */
 export function describeTargetSelector(selector: TargetSelector): string {
-  const descriptions: Record<TargetSelector, string> = {
-    'SELF': 'self',
-    'ONE_OTHER_ALLY_HERE': 'one other ally here',
-    'ALL_ALLIES_HERE': 'all allies here',
-    'ALL_ALLIES_HERE_EXCEPT_SELF': 'all other allies here',
-    'ONE_ENEMY_HERE': 'one enemy here',
-    'ALL_ENEMIES_HERE': 'all enemies here',
-    'HIGHEST_POWER_ENEMY_HERE': 'highest power enemy here',
-    'LOWEST_POWER_ENEMY_HERE': 'lowest power enemy here',
-    'ONE_ALLY_OTHER_LOCATION': 'one ally at another location',
-    'ALL_ALLIES_OTHER_LOCATIONS': 'all allies at other locations',
-    'ONE_ENEMY_AT_DESTINATION': 'one enemy at destination',
-    'LOCATION': 'this location',
-    'RANDOM_VALID_TARGET': 'random target',
-    'FRIENDLY_WITH_DESTROY_TAG': 'allies with Destroy tag',
-    'ENEMY_WITH_BUFF_TAG_HERE': 'enemies with Buff tag here',
-    'ENEMY_WITH_ONGOING_HERE': 'enemies with Ongoing abilities here',
-    'ALLIES_HERE_ARMY_EXCEPT_SELF': 'other Army allies here',
-    'MOVED_CARD': 'the moved card',
-  };
-  
-  return descriptions[selector] ?? `unknown selector: ${selector}`;
+  return TARGET_SELECTOR_DESCRIPTIONS[selector] ?? `unknown selector: ${selector}`;
 }
@@ -44,135 +44,123 @@ interface RawCard {
   deck_group?: number;
 }
 
+type EffectParsers = {
+  readonly [K in Effect['type']]: (raw: RawEffect) => Extract<Effect, { type: K }>;
+};
+
+/** Parser per effect type, looked up by the raw `type` string. */
+const EFFECT_PARSERS: EffectParsers = {
+  AddPowerEffect: raw => ({
+    type: 'AddPowerEffect',
+    target: (raw.target ?? 'SELF') as TargetFilter,
+    amount: raw.amount ?? 0,
+  }),
+  AddOngoingPowerEffect: raw => ({
+    type: 'AddOngoingPowerEffect',
+    target: (raw.target ?? 'SAME_LOCATION_FRIENDLY') as TargetFilter,
+    amount: raw.amount ?? 0,
+  }),
+  ConditionalOngoingPowerEffect: raw => ({
+    type: 'ConditionalOngoingPowerEffect',
+    target: (raw.target ?? 'SAME_LOCATION_FRIENDLY') as TargetFilter,
+    amount: raw.amount ?? 0,
+    condition: raw.condition ?? 'location_full',
+  }),
+  MoveCardEffect: raw => ({
+    type: 'MoveCardEffect',
+    target: (raw.target ?? 'SELF') as TargetFilter,
+    toOtherLocation: raw.to_other_location ?? true,
+  }),
+  DestroyCardEffect: raw => ({
+    type: 'DestroyCardEffect',
+    target: (raw.target ?? 'SELF') as TargetFilter,
+  }),
+  DestroyAndBuffEffect: raw => ({
+    type: 'DestroyAndBuffEffect',
+    destroyTarget: (raw.destroy_target ?? 'ONE_SAME_LOCATION_FRIENDLY') as TargetFilter,
+    buffTarget: (raw.buff_target ?? 'ONE_SAME_LOCATION_ENEMY') as TargetFilter,
+    buffAmount: raw.buff_amount ?? 0,
+  }),
+  ConditionalPowerEffect: raw => ({
+    type: 'ConditionalPowerEffect',
+    target: (raw.target ?? 'SELF') as TargetFilter,
+    amount: raw.amount ?? 0,
+    condition: (raw.condition ?? 'only_card_here') as 'only_card_here' | 'destroyed_this_game' | 'moved_this_game',
+  }),
+  SilenceOngoingEffect: raw => ({
+    type: 'SilenceOngoingEffect',
+    target: (raw.target ?? 'SAME_LOCATION_ENEMY') as TargetFilter,
+  }),
+  StealPowerEffect: raw => ({
+    type: 'StealPowerEffect',
+    target: (raw.target ?? 'ONE_SAME_LOCATION_ENEMY') as TargetFilter,
+    amount: raw.amount ?? 0,
+  }),
+  ScalingOngoingPowerEffect: raw => ({
+    type: 'ScalingOngoingPowerEffect',
+    target: (raw.target ?? 'SAME_LOCATION_FRIENDLY') as TargetFilter,
+    perCardAmount: raw.per_card_amount ?? 1,
+    countFilter: (raw.count_filter ?? 'SAME_LOCATION_FRIENDLY') as TargetFilter,
+  }),
+  ScalingPowerEffect: raw => ({
+    type: 'ScalingPowerEffect',
+    target: (raw.target ?? 'SELF') as TargetFilter,
+    perDestroyedAmount: raw.per_destroyed_amount ?? 2,
+  }),
+  ReviveEffect: () => ({
+    type: 'ReviveEffect',
+    baseSpiritPower: 2,
+  }),
+  AddEnergyNextTurnEffect: raw => ({
+    type: 'AddEnergyNextTurnEffect',
+    amount: raw.amount ?? 1,
+  }),
+  DestroyAndGainPowerEffect: raw => ({
+    type: 'DestroyAndGainPowerEffect',
+    destroyTarget: (raw.destroy_target ?? 'ONE_SAME_LOCATION_FRIENDLY') as TargetFilter,
+    gainTarget: (raw.gain_target ?? 'SELF') as TargetFilter,
+  }),
+  GlobalOngoingPowerEffect: raw => ({
+    type: 'GlobalOngoingPowerEffect',
+    target: (raw.target ?? 'ALL_FRIENDLY_DESTROY_TAGGED') as TargetFilter,
+    amount: raw.amount ?? 0,
+  }),
+  MoveAndSelfBuffEffect: raw => ({
+    type: 'MoveAndSelfBuffEffect',
+    moveTarget: (raw.move_target ?? 'SELF') as TargetFilter,
+    buffAmount: raw.buff_amount ?? 0,
+  }),
+  DestroyAndSelfBuffEffect: raw => ({
+    type: 'DestroyAndSelfBuffEffect',
+    destroyTarget: (raw.destroy_target ?? 'ONE_SAME_LOCATION_FRIENDLY') as TargetFilter,
+    buffAmount: raw.buff_amount ?? 0,
+  }),
+  MoveAndBuffEffect: raw => ({
+    type: 'MoveAndBuffEffect',
+    moveTarget: (raw.move_target ?? 'ONE_OTHER_LOCATION_FRIENDLY_TO_HERE') as TargetFilter,
+    buffTarget: (raw.buff_target ?? 'MOVED_CARD') as TargetFilter,
+    buffAmount: raw.buff_amount ?? 0,
+  }),
+  MoveAndDebuffDestinationEffect: raw => ({
+    type: 'MoveAndDebuffDestinationEffect',
+    debuffAmount: raw.debuff_amount ?? -1,
+  }),
+  ProtectFromDebuffEffect: raw => ({
+    type: 'ProtectFromDebuffEffect',
+    target: (raw.target ?? 'SAME_LOCATION_FRIENDLY_EXCEPT_SELF') as TargetFilter,
+  }),
+};
+
 function parseEffect(raw: RawEffect): Effect {
-  switch (raw.type) {
-    case 'AddPowerEffect':
-      return {
-        type: 'AddPowerEffect',
-        target: (raw.target ?? 'SELF') as TargetFilter,
-        amount: raw.amount ?? 0,
-      };
-    case 'AddOngoingPowerEffect':
-      return {
-        type: 'AddOngoingPowerEffect',
-        target: (raw.target ?? 'SAME_LOCATION_FRIENDLY') as TargetFilter,
-        amount: raw.amount ?? 0,
-      };
-    case 'ConditionalOngoingPowerEffect':
-      return {
-        type: 'ConditionalOngoingPowerEffect',
-        target: (raw.target ?? 'SAME_LOCATION_FRIENDLY') as TargetFilter,
-        amount: raw.amount ?? 0,
-        condition: raw.condition ?? 'location_full',
-      };
-    case 'MoveCardEffect':
-      return {
-        type: 'MoveCardEffect',
-        target: (raw.target ?? 'SELF') as TargetFilter,
-        toOtherLocation: raw.to_other_location ?? true,
-      };
-    case 'DestroyCardEffect':
-      return {
-        type: 'DestroyCardEffect',
-        target: (raw.target ?? 'SELF') as TargetFilter,
-      };
-    case 'DestroyAndBuffEffect':
-      return {
-        type: 'DestroyAndBuffEffect',
-        destroyTarget: (raw.destroy_target ?? 'ONE_SAME_LOCATION_FRIENDLY') as TargetFilter,
-        buffTarget: (raw.buff_target ?? 'ONE_SAME_LOCATION_ENEMY') as TargetFilter,
-        buffAmount: raw.buff_amount ?? 0,
-      };
-    case 'ConditionalPowerEffect':
-      return {
-        type: 'ConditionalPowerEffect',
-        target: (raw.target ?? 'SELF') as TargetFilter,
-        amount: raw.amount ?? 0,
-        condition: (raw.condition ?? 'only_card_here') as 'only_card_here' | 'destroyed_this_game' | 'moved_this_game',
-      };
-    case 'SilenceOngoingEffect':
-      return {
-        type: 'SilenceOngoingEffect',
-        target: (raw.target ?? 'SAME_LOCATION_ENEMY') as TargetFilter,
-      };
-    case 'StealPowerEffect':
-      return {
-        type: 'StealPowerEffect',
-        target: (raw.target ?? 'ONE_SAME_LOCATION_ENEMY') as TargetFilter,
-        amount: raw.amount ?? 0,
-      };
-    case 'ScalingOngoingPowerEffect':
-      return {
-        type: 'ScalingOngoingPowerEffect',
-        target: (raw.target ?? 'SAME_LOCATION_FRIENDLY') as TargetFilter,
-        perCardAmount: raw.per_card_amount ?? 1,
-        countFilter: (raw.count_filter ?? 'SAME_LOCATION_FRIENDLY') as TargetFilter,
-      };
-    case 'ScalingPowerEffect':
-      return {
-        type: 'ScalingPowerEffect',
-        target: (raw.target ?? 'SELF') as TargetFilter,
-        perDestroyedAmount: raw.per_destroyed_amount ?? 2,
-      };
-    case 'ReviveEffect':
-      return {
-        type: 'ReviveEffect',
-        baseSpiritPower: 2,
-      };
-    case 'AddEnergyNextTurnEffect':
-      return {
-        type: 'AddEnergyNextTurnEffect',
-        amount: raw.amount ?? 1,
-      };
-    case 'DestroyAndGainPowerEffect':
-      return {
-        type: 'DestroyAndGainPowerEffect',
-        destroyTarget: (raw.destroy_target ?? 'ONE_SAME_LOCATION_FRIENDLY') as TargetFilter,
-        gainTarget: (raw.gain_target ?? 'SELF') as TargetFilter,
-      };
-    case 'GlobalOngoingPowerEffect':
-      return {
-        type: 'GlobalOngoingPowerEffect',
-        target: (raw.target ?? 'ALL_FRIENDLY_DESTROY_TAGGED') as TargetFilter,
-        amount: raw.amount ?? 0,
-      };
-    case 'MoveAndSelfBuffEffect':
-      return {
-        type: 'MoveAndSelfBuffEffect',
-        moveTarget: (raw.move_target ?? 'SELF') as TargetFilter,
-        buffAmount: raw.buff_amount ?? 0,
-      };
-    case 'DestroyAndSelfBuffEffect':
-      return {
-        type: 'DestroyAndSelfBuffEffect',
-        destroyTarget: (raw.destroy_target ?? 'ONE_SAME_LOCATION_FRIENDLY') as TargetFilter,
-        buffAmount: raw.buff_amount ?? 0,
-      };
-    case 'MoveAndBuffEffect':
-      return {
-        type: 'MoveAndBuffEffect',
-        moveTarget: (raw.move_target ?? 'ONE_OTHER_LOCATION_FRIENDLY_TO_HERE') as TargetFilter,
-        buffTarget: (raw.buff_target ?? 'MOVED_CARD') as TargetFilter,
-        buffAmount: raw.buff_amount ?? 0,
-      };
-    case 'MoveAndDebuffDestinationEffect':
-      return {
-        type: 'MoveAndDebuffDestinationEffect',
-        debuffAmount: raw.debuff_amount ?? -1,
-      };
-    case 'ProtectFromDebuffEffect':
-      return {
-        type: 'ProtectFromDebuffEffect',
-        target: (raw.target ?? 'SAME_LOCATION_FRIENDLY_EXCEPT_SELF') as TargetFilter,
-      };
-    default:
-      // Unknown effect, return a no-op
-      return {
-        type: 'AddPowerEffect',
-        target: 'SELF',
-        amount: 0,
-      };
+  if (Object.prototype.hasOwnProperty.call(EFFECT_PARSERS, raw.type)) {
+    return EFFECT_PARSERS[raw.type as Effect['type']](raw);
   }
+  // Unknown effect, return a no-op
+  return {
+    type: 'AddPowerEffect',
+    target: 'SELF',
+    amount: 0,
+  };
 }
 
 function parseCard(raw: RawCard): CardDef {
@@ -197,10 +185,24 @@ function parseCard(raw: RawCard): CardDef {
 
 const ALL_CARDS: Map<CardId, CardDef> = new Map();
 
+const CARDS_BY_COST: Map<number, CardDef[]> = new Map();
+
 // Parse all cards on module load
 for (const rawCard of cardsData.cards as RawCard[]) {
   const card = parseCard(rawCard);
   ALL_CARDS.set(card.id, card);
+
+  const sameCost = CARDS_BY_COST.get(card.cost);
+  if (sameCost) {
+    sameCost.push(card);
+  } else {
+    CARDS_BY_COST.set(card.cost, [card]);
+  }
+}
+
+// getCardsByCostMap hands out the buckets themselves, so lock them once built
+for (const sameCost of CARDS_BY_COST.values()) {
+  Object.freeze(sameCost);
 }
 
 export function getCardDef(id: CardId): CardDef | undefined {
@@ -216,22 +218,17 @@ export function getAllCardDefs(): CardDef[] {
  * Used for finding same-strength replacement cards.
  */
 export function getCardsByCost(cost: number): CardDef[] {
-  return Array.from(ALL_CARDS.values()).filter(card => card.cost === cost);
+  return [...(CARDS_BY_COST.get(cost) ?? [])];
 }
 
 /**
  * Get cards grouped by cost for efficient lookups.
+ * The grouping is built once when the card data is loaded and shared by
+ * every caller: the map must not be mutated, and its per-cost arrays are
+ * frozen. Use getCardsByCost for a copy that can be modified.
  */
-export function getCardsByCostMap(): Map<number, CardDef[]> {
-  const byCost = new Map<number, CardDef[]>();
-  for (const card of ALL_CARDS.values()) {
-    const cost = card.cost;
-    if (!byCost.has(cost)) {
-      byCost.set(cost, []);
-    }
-    byCost.get(cost)!.push(card);
-  }
-  return byCost;
+export function getCardsByCostMap(): ReadonlyMap<number, readonly CardDef[]> {
+  return CARDS_BY_COST;
 }
 
 // =============================================================================
@@ -3,15 +3,20 @@
  * 
  * Tests cover:
  * - computeWinner() - game result determination
- * - countLocationsWon() - location counting helper
+ * - countLocationsWon() / countLocationsWonByPlayer() - location counting helpers
  * - Perfect win detection logic
+ * - createGameWithSeed() - starting hands
+ * - getLegalActions() - legal play enumeration
+ * - applyCardPlay() - planning-phase card plays
  */
 
 import { describe, it, expect } from 'vitest';
 import type { GameState, PlayerState, CardInstance, CardDef, LocationState } from './models';
 import { createInitialLocations } from './models';
-import { computeWinner, countLocationsWon } from './controller';
+import { applyCardPlay, computeWinner, countLocationsWon, countLocationsWonByPlayer, createGameWithSeed, getLegalActions, validateAction } from './controller';
 import type { PlayerId, TurnNumber, InstanceId } from './types';
+import { STARTING_HAND_SIZE } from './types';
+import { getDeckCardIds } from './cards';
 
 // =============================================================================
 // Test Helpers
@@ -298,6 +303,16 @@ describe('countLocationsWon', () => {
     expect(countLocationsWon(state, 0)).toBe(3);
     expect(countLocationsWon(state, 1)).toBe(0);
   });
+
+  it('should count both players in one call', () => {
+    const state = createTestState([
+      [[makeCard(1, 5, 0)], [makeCard(2, 3, 1)]],  // P0 wins
+      [[makeCard(3, 4, 0)], [makeCard(4, 4, 1)]],  // Tie
+      [[makeCard(5, 1, 0)], [makeCard(6, 3, 1)]],  // P1 wins
+    ]);
+
+    expect(countLocationsWonByPlayer(state)).toEqual([1, 1]);
+  });
 });
 
 // =============================================================================
@@ -354,3 +369,107 @@ describe('Perfect Win Detection', () => {
     expect(locationWinners).toEqual([0, 1, null]);
   });
 });
+
+// =============================================================================
+// Game Creation Tests
+// =============================================================================
+
+describe('createGameWithSeed', () => {
+  // createDeck numbers instances in deck order: player 0 from 0, player 1
+  // straight after player 0's deck, so these are the original deck orders
+  const deckSize = getDeckCardIds('starter').length;
+  const originalDeckIds = (playerId: PlayerId): InstanceId[] =>
+    Array.from({ length: deckSize }, (_, i) => playerId * deckSize + i);
+
+  it('should deal the top STARTING_HAND_SIZE cards of each deck in order', () => {
+    const { state } = createGameWithSeed(42);
+
+    for (const player of state.players) {
+      const deckIds = originalDeckIds(player.playerId);
+      expect(player.hand.map(c => c.instanceId)).toEqual(deckIds.slice(0, STARTING_HAND_SIZE));
+      expect(player.deck.map(c => c.instanceId)).toEqual(deckIds.slice(STARTING_HAND_SIZE));
+      expect(player.hand.every(c => c.owner === player.playerId)).toBe(true);
+    }
+  });
+
+  it('should emit CardDrawn events alternating between players', () => {
+    const { events } = createGameWithSeed(42);
+
+    const expected = [];
+    for (let i = 0; i < STARTING_HAND_SIZE; i++) {
+      expected.push({ type: 'CardDrawn', playerId: 0, cardInstanceId: originalDeckIds(0)[i] });
+      expected.push({ type: 'CardDrawn', playerId: 1, cardInstanceId: originalDeckIds(1)[i] });
+    }
+    expect(events.filter(e => e.type === 'CardDrawn')).toEqual(expected);
+  });
+});
+
+// =============================================================================
+// getLegalActions / applyCardPlay Tests
+// =============================================================================
+
+function withHand(state: GameState, hand: CardInstance[], energy: number): GameState {
+  const player0: PlayerState = { ...state.players[0], hand, energy, maxEnergy: energy };
+  return { ...state, players: [player0, state.players[1]] };
+}
+
+function withCost(card: CardInstance, cost: number): CardInstance {
+  return { ...card, cardDef: { ...card.cardDef, cost } };
+}
+
+describe('getLegalActions', () => {
+  it('should skip full locations and unaffordable cards', () => {
+    const fullLocation = [1, 2, 3, 4].map(id => makeCard(id, 1, 0));
+    const base = createTestState([[[], []], [fullLocation, []], [[], []]]);
+    const cheap = withCost(makeCard(10, 2, 0), 1);
+    const expensive = withCost(makeCard(11, 5, 0), 5);
+    const state = withHand(base, [cheap, expensive], 2);
+
+    const actions = getLegalActions(state, 0);
+
+    expect(actions).toEqual([
+      { type: 'Pass', playerId: 0 },
+      { type: 'PlayCard', playerId: 0, cardInstanceId: 10, location: 0 },
+      { type: 'PlayCard', playerId: 0, cardInstanceId: 10, location: 2 },
+    ]);
+    expect(actions.every(a => validateAction(state, a).valid)).toBe(true);
+  });
+
+  it('should only allow passing when every location is full', () => {
+    const full = (offset: number) => [1, 2, 3, 4].map(id => makeCard(offset + id, 1, 0));
+    const base = createTestState([[full(0), []], [full(10), []], [full(20), []]]);
+    const state = withHand(base, [withCost(makeCard(99, 1, 0), 1)], 6);
+
+    expect(getLegalActions(state, 0)).toEqual([{ type: 'Pass', playerId: 0 }]);
+  });
+});
+
+describe('applyCardPlay', () => {
+  it('should move the card from hand to the location and spend its cost', () => {
+    const base = createTestState([[[], []], [[], []], [[], []]]);
+    const card = withCost(makeCard(10, 2, 0), 2);
+    const state = withHand(base, [card, withCost(makeCard(11, 1, 0), 1)], 3);
+
+    const next = applyCardPlay(state, { type: 'PlayCard', playerId: 0, cardInstanceId: 10, location: 1 });
+
+    expect(next.players[0].hand.map(c => c.instanceId)).toEqual([11]);
+    expect(next.players[0].energy).toBe(1);
+    expect(next.locations[1].cardsByPlayer[0]).toEqual([{ ...card, revealed: false }]);
+    expect(next.players[1]).toBe(state.players[1]);
+  });
+
+  it('should place the card face up when asked', () => {
+    const base = createTestState([[[], []], [[], []], [[], []]]);
+    const state = withHand(base, [withCost(makeCard(10, 2, 0), 1)], 1);
+
+    const next = applyCardPlay(state, { type: 'PlayCard', playerId: 0, cardInstanceId: 10, location: 0 }, true);
+
+    expect(next.locations[0].cardsByPlayer[0][0]?.revealed).toBe(true);
+  });
+
+  it('should leave the state unchanged for a card not in hand', () => {
+    const state = createTestState([[[], []], [[], []], [[], []]]);
+
+    expect(applyCardPlay(state, { type: 'PlayCard', playerId: 0, cardInstanceId: 99, location: 0 })).toBe(state);
+  });
+});
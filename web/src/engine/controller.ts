@@ -20,23 +20,19 @@ import {
   getLocation,
   withPlayer,
   withLocation,
-  withTurn,
   withPhase,
-  withResult,
-  drawCard,
+  drawCards,
   drawCardWeighted,
   spendEnergy,
   removeFromHand,
   addCard,
   getCardCount,
   getTotalPower,
-  clearTurnTracking,
   getBonusEnergyNextTurn,
-  clearBonusEnergyNextTurn,
 } from './models';
 import type { GameEvent } from './events';
-import type { PlayerId, LocationIndex, TurnNumber } from './types';
-import { MAX_TURNS, LOCATION_CAPACITY, STARTING_HAND_SIZE, MAX_HAND_SIZE, isValidLocationIndex } from './types';
+import type { PlayerId, PlayerTuple, TurnNumber } from './types';
+import { MAX_TURNS, LOCATION_CAPACITY, STARTING_HAND_SIZE, MAX_HAND_SIZE, ALL_LOCATIONS, BOTH_PLAYERS, isValidLocationIndex } from './types';
 import { getDeckCardDefs, createDeck, shuffleDeckByCost, getCardDefsFromIds, getCardsByCostMap } from './cards';
 import type { CardDef } from './models';
 import type { CardId } from './types';
@@ -51,6 +47,32 @@ import type { PlayedCard, ResolutionTimeline } from './timeline/types';
 // Game Creation
 // =============================================================================
 
+/**
+ * Draw both starting hands with one player update each.
+ * CardDrawn events are emitted alternating between players, as if dealt.
+ */
+function drawStartingHands(
+  player0: PlayerState,
+  player1: PlayerState,
+  events: GameEvent[]
+): [PlayerState, PlayerState] {
+  const [newP0, drawn0] = drawCards(player0, STARTING_HAND_SIZE);
+  const [newP1, drawn1] = drawCards(player1, STARTING_HAND_SIZE);
+
+  for (let i = 0; i < STARTING_HAND_SIZE; i++) {
+    const card0 = drawn0[i];
+    if (card0) {
+      events.push({ type: 'CardDrawn', playerId: 0, cardInstanceId: card0.instanceId });
+    }
+    const card1 = drawn1[i];
+    if (card1) {
+      events.push({ type: 'CardDrawn', playerId: 1, cardInstanceId: card1.instanceId });
+    }
+  }
+
+  return [newP0, newP1];
+}
+
 export function createGame(): { state: GameState; events: GameEvent[] } {
   const events: GameEvent[] = [];
 
@@ -61,37 +83,26 @@ export function createGame(): { state: GameState; events: GameEvent[] } {
   const { deck: deck0, nextId: nextId0 } = createDeck(p0Defs, 0, 0);
   const { deck: deck1, nextId: nextId1 } = createDeck(p1Defs, 1, nextId0);
 
-  // Create player states
+  // Create player states with turn 1 energy
+  const startingEnergy = 1;
   let player0: PlayerState = {
     playerId: 0,
     deck: deck0,
     hand: [],
-    energy: 0,
-    maxEnergy: 0,
+    energy: startingEnergy,
+    maxEnergy: startingEnergy,
   };
 
   let player1: PlayerState = {
     playerId: 1,
     deck: deck1,
     hand: [],
-    energy: 0,
-    maxEnergy: 0,
+    energy: startingEnergy,
+    maxEnergy: startingEnergy,
   };
 
   // Draw initial hands
-  for (let i = 0; i < STARTING_HAND_SIZE; i++) {
-    const [newP0, card0] = drawCard(player0);
-    player0 = newP0;
-    if (card0) {
-      events.push({ type: 'CardDrawn', playerId: 0, cardInstanceId: card0.instanceId });
-    }
-
-    const [newP1, card1] = drawCard(player1);
-    player1 = newP1;
-    if (card1) {
-      events.push({ type: 'CardDrawn', playerId: 1, cardInstanceId: card1.instanceId });
-    }
-  }
+  [player0, player1] = drawStartingHands(player0, player1, events);
 
   const state: GameState = {
     turn: 1 as TurnNumber,
@@ -107,20 +118,12 @@ export function createGame(): { state: GameState; events: GameEvent[] } {
     bonusEnergyNextTurn: [0, 0],
   };
 
-  // Set energy for turn 1
-  const startingEnergy = 1;
-  const stateWithEnergy = withPlayer(
-    withPlayer(state, 0, { ...player0, energy: startingEnergy, maxEnergy: startingEnergy }),
-    1,
-    { ...player1, energy: startingEnergy, maxEnergy: startingEnergy }
-  );
-
   events.push({ type: 'GameStarted' });
   events.push({ type: 'TurnStarted', turn: 1 as TurnNumber });
   events.push({ type: 'EnergySet', playerId: 0, energy: startingEnergy });
   events.push({ type: 'EnergySet', playerId: 1, energy: startingEnergy });
 
-  return { state: stateWithEnergy, events };
+  return { state, events };
 }
 
 // =============================================================================
@@ -128,25 +131,42 @@ export function createGame(): { state: GameState; events: GameEvent[] } {
 // =============================================================================
 
 /**
- * Count how many locations a player is currently winning.
+ * Count how many locations each player is currently winning, in one pass.
  * A player wins a location if they have strictly more power than the opponent.
  */
-export function countLocationsWon(state: GameState, playerId: PlayerId): number {
-  const enemyId = (1 - playerId) as PlayerId;
-  let count = 0;
+export function countLocationsWonByPlayer(state: GameState): PlayerTuple<number> {
+  let p0Wins = 0;
+  let p1Wins = 0;
 
   for (const location of state.locations) {
-    const playerPower = getTotalPower(location, playerId);
-    const enemyPower = getTotalPower(location, enemyId);
-    if (playerPower > enemyPower) {
-      count++;
+    const p0Power = getTotalPower(location, 0);
+    const p1Power = getTotalPower(location, 1);
+    if (p0Power > p1Power) {
+      p0Wins++;
+    } else if (p1Power > p0Power) {
+      p1Wins++;
     }
   }
 
-  return count;
+  return [p0Wins, p1Wins];
+}
+
+/**
+ * Count how many locations a player is currently winning.
+ */
+export function countLocationsWon(state: GameState, playerId: PlayerId): number {
+  return countLocationsWonByPlayer(state)[playerId];
 }
 
-export function startNextTurn(state: GameState): { state: GameState; events: GameEvent[] } {
+/**
+ * Start the next turn: set energy (with location and card-effect bonuses)
+ * and refill both hands with weighted draws.
+ * Pass `rng` to make the draws reproducible; Math.random is used otherwise.
+ */
+export function startNextTurn(
+  state: GameState,
+  rng?: SeededRNG
+): { state: GameState; events: GameEvent[] } {
   const events: GameEvent[] = [];
 
   const newTurn = (state.turn + 1) as TurnNumber;
@@ -155,22 +175,21 @@ export function startNextTurn(state: GameState): { state: GameState; events: Gam
     return { state, events };
   }
 
-  let newState = withTurn(state, newTurn);
-  newState = withPhase(newState, 'PLANNING');
-  newState = clearTurnTracking(newState);
-
   events.push({ type: 'TurnStarted', turn: newTurn });
 
+  // Location bonus uses the board from the END of the previous turn
+  const locationsWonByPlayer = countLocationsWonByPlayer(state);
+  const players: [PlayerState, PlayerState] = [state.players[0], state.players[1]];
+
   // Set energy and draw cards
-  for (const playerId of [0, 1] as PlayerId[]) {
-    let player = getPlayer(newState, playerId);
+  for (const playerId of BOTH_PLAYERS) {
+    let player = players[playerId];
 
     // Base energy = turn number
     const baseEnergy = newTurn;
 
     // Bonus energy from locations: +1 for each location currently won
-    // Use the state from END of previous turn (before this turn's updates)
-    const locationsWon = countLocationsWon(state, playerId);
+    const locationsWon = locationsWonByPlayer[playerId];
     const locationBonus = locationsWon;
 
     // Bonus energy from card effects (e.g., Iris)
@@ -180,7 +199,6 @@ export function startNextTurn(state: GameState): { state: GameState; events: Gam
     const totalEnergy = baseEnergy + totalBonus;
 
     player = { ...player, energy: totalEnergy, maxEnergy: totalEnergy };
-    newState = withPlayer(newState, playerId, player);
     events.push({ type: 'EnergySet', playerId, energy: baseEnergy });
 
     // Emit bonus energy event if player gets bonus from locations
@@ -208,20 +226,29 @@ export function startNextTurn(state: GameState): { state: GameState; events: Gam
     // Draw cards to fill hand to 4 cards (weighted towards higher cost cards on later turns)
     const TARGET_HAND_SIZE = 4;
     while (player.hand.length < TARGET_HAND_SIZE && player.hand.length < MAX_HAND_SIZE) {
-      const [drawnPlayer, card] = drawCardWeighted(player, newTurn);
+      const [drawnPlayer, card] = drawCardWeighted(player, newTurn, rng);
       if (card) {
         player = drawnPlayer;
-        newState = withPlayer(newState, playerId, player);
         events.push({ type: 'CardDrawn', playerId, cardInstanceId: card.instanceId });
       } else {
         // No more cards in deck
         break;
       }
     }
+
+    players[playerId] = player;
   }
 
-  // Clear bonus energy from card effects (it's been consumed)
-  newState = clearBonusEnergyNextTurn(newState);
+  // Apply the new turn in one update: clear per-turn tracking and the
+  // consumed card-effect bonus energy
+  const newState: GameState = {
+    ...state,
+    turn: newTurn,
+    phase: 'PLANNING',
+    players,
+    cardsMovedThisTurn: state.cardsMovedThisTurn.length > 0 ? [] : state.cardsMovedThisTurn,
+    bonusEnergyNextTurn: [0, 0],
+  };
 
   return { state: newState, events };
 }
@@ -238,38 +265,42 @@ export function startNextTurnWithSimpleDraw(state: GameState): { state: GameStat
     return { state, events };
   }
 
-  let newState = withTurn(state, newTurn);
-  newState = withPhase(newState, 'PLANNING');
-  newState = clearTurnTracking(newState);
-
   events.push({ type: 'TurnStarted', turn: newTurn });
 
-  for (const playerId of [0, 1] as PlayerId[]) {
-    let player = getPlayer(newState, playerId);
+  const locationsWonByPlayer = countLocationsWonByPlayer(state);
+  const players: [PlayerState, PlayerState] = [state.players[0], state.players[1]];
+
+  for (const playerId of BOTH_PLAYERS) {
+    let player = players[playerId];
 
     const baseEnergy = newTurn;
-    const locationsWon = countLocationsWon(state, playerId);
+    const locationsWon = locationsWonByPlayer[playerId];
     const cardEffectBonus = getBonusEnergyNextTurn(state, playerId);
     const totalEnergy = baseEnergy + locationsWon + cardEffectBonus;
 
     player = { ...player, energy: totalEnergy, maxEnergy: totalEnergy };
-    newState = withPlayer(newState, playerId, player);
     events.push({ type: 'EnergySet', playerId, energy: baseEnergy });
 
     const TARGET_HAND_SIZE = 4;
-    while (player.hand.length < TARGET_HAND_SIZE && player.hand.length < MAX_HAND_SIZE) {
-      const [drawnPlayer, card] = drawCard(player);
-      if (card) {
-        player = drawnPlayer;
-        newState = withPlayer(newState, playerId, player);
-        events.push({ type: 'CardDrawn', playerId, cardInstanceId: card.instanceId });
-      } else {
-        break;
-      }
+    const [drawnPlayer, drawn] = drawCards(
+      player,
+      Math.min(TARGET_HAND_SIZE, MAX_HAND_SIZE) - player.hand.length
+    );
+    for (const card of drawn) {
+      events.push({ type: 'CardDrawn', playerId, cardInstanceId: card.instanceId });
     }
+
+    players[playerId] = drawnPlayer;
   }
 
-  newState = clearBonusEnergyNextTurn(newState);
+  const newState: GameState = {
+    ...state,
+    turn: newTurn,
+    phase: 'PLANNING',
+    players,
+    cardsMovedThisTurn: state.cardsMovedThisTurn.length > 0 ? [] : state.cardsMovedThisTurn,
+    bonusEnergyNextTurn: [0, 0],
+  };
   return { state: newState, events };
 }
 
@@ -319,24 +350,59 @@ export function validateAction(state: GameState, action: PlayerAction): Validati
 export function getLegalActions(state: GameState, playerId: PlayerId): PlayerAction[] {
   const actions: PlayerAction[] = [{ type: 'Pass', playerId }];
 
+  // Same checks as validateAction, but capacity is checked once per location
+  // and energy once per card instead of once per (card, location) pair
+  const openLocations = ALL_LOCATIONS.filter(
+    locIdx => getCardCount(getLocation(state, locIdx), playerId) < LOCATION_CAPACITY
+  );
+  if (openLocations.length === 0) return actions;
+
   const player = getPlayer(state, playerId);
   for (const card of player.hand) {
-    for (const locIdx of [0, 1, 2] as LocationIndex[]) {
-      const action: PlayCardAction = {
+    if (card.cardDef.cost > player.energy) continue;
+    for (const locIdx of openLocations) {
+      actions.push({
         type: 'PlayCard',
         playerId,
         cardInstanceId: card.instanceId,
         location: locIdx,
-      };
-      if (validateAction(state, action).valid) {
-        actions.push(action);
-      }
+      });
     }
   }
 
   return actions;
 }
 
+// =============================================================================
+// Card Play
+// =============================================================================
+
+/**
+ * Apply a card play immediately to the game state: the card leaves the hand,
+ * its cost is spent and it is placed at the target location.
+ * Used while planning, before the turn is resolved.
+ *
+ * @param revealed - Whether the placed card is shown face up
+ */
+export function applyCardPlay(
+  state: GameState,
+  action: PlayCardAction,
+  revealed: boolean = false
+): GameState {
+  const { playerId, cardInstanceId, location: locationIndex } = action;
+  const player = getPlayer(state, playerId);
+
+  // Remove card from hand
+  const [playerWithoutCard, card] = removeFromHand(player, cardInstanceId);
+  if (!card) return state;
+
+  // Spend energy
+  const newState = withPlayer(state, playerId, spendEnergy(playerWithoutCard, card.cardDef.cost));
+
+  const location = getLocation(newState, locationIndex);
+  return withLocation(newState, locationIndex, addCard(location, { ...card, revealed }, playerId));
+}
+
 // =============================================================================
 // NOTE: Legacy resolveTurn() and its helper functions have been removed.
 // All turn resolution now uses resolveTurnDeterministic() which provides
@@ -557,8 +623,7 @@ export function resolveTurnDeterministic(
   // Check for game end
   if (newState.turn >= MAX_TURNS) {
     const { result, locationWinners, locationPowers, totalPower } = computeWinner(newState);
-    newState = withResult(newState, result);
-    newState = withPhase(newState, 'GAME_OVER');
+    newState = { ...newState, result, phase: 'GAME_OVER' };
     events.push({
       type: 'GameEnded',
       result,
@@ -705,37 +770,26 @@ export function createGameWithSeed(
   const { deck: deck0, nextId: nextId0 } = createDeck(p0Defs, 0, 0);
   const { deck: deck1, nextId: nextId1 } = createDeck(p1Defs, 1, nextId0);
   
-  // Create player states
+  // Create player states with turn 1 energy
+  const startingEnergy = 1;
   let player0: PlayerState = {
     playerId: 0,
     deck: deck0,
     hand: [],
-    energy: 0,
-    maxEnergy: 0,
+    energy: startingEnergy,
+    maxEnergy: startingEnergy,
   };
   
   let player1: PlayerState = {
     playerId: 1,
     deck: deck1,
     hand: [],
-    energy: 0,
-    maxEnergy: 0,
+    energy: startingEnergy,
+    maxEnergy: startingEnergy,
   };
   
   // Draw initial hands
-  for (let i = 0; i < STARTING_HAND_SIZE; i++) {
-    const [newP0, card0] = drawCard(player0);
-    player0 = newP0;
-    if (card0) {
-      events.push({ type: 'CardDrawn', playerId: 0, cardInstanceId: card0.instanceId });
-    }
-    
-    const [newP1, card1] = drawCard(player1);
-    player1 = newP1;
-    if (card1) {
-      events.push({ type: 'CardDrawn', playerId: 1, cardInstanceId: card1.instanceId });
-    }
-  }
+  [player0, player1] = drawStartingHands(player0, player1, events);
   
   const state: GameState = {
     turn: 1 as TurnNumber,
@@ -751,20 +805,12 @@ export function createGameWithSeed(
     bonusEnergyNextTurn: [0, 0],
   };
   
-  // Set energy for turn 1
-  const startingEnergy = 1;
-  const stateWithEnergy = withPlayer(
-    withPlayer(state, 0, { ...player0, energy: startingEnergy, maxEnergy: startingEnergy }),
-    1,
-    { ...player1, energy: startingEnergy, maxEnergy: startingEnergy }
-  );
-  
   events.push({ type: 'GameStarted' });
   events.push({ type: 'TurnStarted', turn: 1 as TurnNumber });
   events.push({ type: 'EnergySet', playerId: 0, energy: startingEnergy });
   events.push({ type: 'EnergySet', playerId: 1, energy: startingEnergy });
   
-  return { state: stateWithEnergy, events, rng };
+  return { state, events, rng };
 }
 
 /**
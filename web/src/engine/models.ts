@@ -20,7 +20,9 @@ import type {
   LocationTuple,
   PlayerTuple,
 } from './types';
+import { BOTH_PLAYERS, getOpponentId } from './types';
 import type { Effect } from './effects';
+import type { SeededRNG } from './rng';
 
 // =============================================================================
 // Card Definitions
@@ -127,14 +129,32 @@ export function drawCard(player: PlayerState): [PlayerState, CardInstance | null
   ];
 }
 
+/** Draw up to `count` cards from the top of the deck in one update. Returns [newState, drawnCards] */
+export function drawCards(player: PlayerState, count: number): [PlayerState, readonly CardInstance[]] {
+  if (count <= 0 || player.deck.length === 0) {
+    return [player, []];
+  }
+  const drawn = player.deck.slice(0, count);
+
+  return [
+    { ...player, deck: player.deck.slice(count), hand: [...player.hand, ...drawn] },
+    drawn,
+  ];
+}
+
 /**
  * Draw a card with weighted probability based on turn number.
  * Higher cost cards become more likely as turns progress.
  * @param player - The player state
  * @param turn - Current turn number (1-6)
+ * @param rng - Optional seeded RNG for reproducible draws (defaults to Math.random)
  * @returns [newPlayerState, drawnCard | null]
  */
-export function drawCardWeighted(player: PlayerState, turn: number): [PlayerState, CardInstance | null] {
+export function drawCardWeighted(
+  player: PlayerState,
+  turn: number,
+  rng?: SeededRNG
+): [PlayerState, CardInstance | null] {
   if (player.deck.length === 0) {
     return [player, null];
   }
@@ -155,7 +175,7 @@ export function drawCardWeighted(player: PlayerState, turn: number): [PlayerStat
   const totalWeight = weights.reduce((sum, w) => sum + w, 0);
 
   // Random selection based on weights
-  let random = Math.random() * totalWeight;
+  let random = (rng ? rng.next() : Math.random()) * totalWeight;
   let selectedIndex = 0;
 
   for (let i = 0; i < weights.length; i++) {
@@ -190,7 +210,8 @@ export function removeFromHand(
   if (index === -1) return [player, null];
 
   const card = player.hand[index]!;
-  const newHand = [...player.hand.slice(0, index), ...player.hand.slice(index + 1)];
+  const newHand = [...player.hand];
+  newHand.splice(index, 1);
   return [{ ...player, hand: newHand }, card];
 }
 
@@ -227,40 +248,97 @@ export function addCard(location: LocationState, card: CardInstance, playerId: P
   return { ...location, cardsByPlayer: newCards };
 }
 
-/** Remove a card from this location */
-export function removeCard(
+/**
+ * Replace one card at this location with `update(card)`, or remove it when
+ * `update` returns null. Only the side holding the card is copied.
+ * Returns the new location, the original card and where it sat
+ * (`playerId`, `index`), or null if the card is not here.
+ */
+function withSideCard(
   location: LocationState,
-  instanceId: InstanceId
-): [LocationState, CardInstance | null] {
-  let removedCard: CardInstance | null = null;
-  const newCardsByPlayer: [readonly CardInstance[], readonly CardInstance[]] = [[], []];
-
-  for (const playerId of [0, 1] as PlayerId[]) {
-    const filtered: CardInstance[] = [];
-    for (const card of location.cardsByPlayer[playerId]) {
-      if (card.instanceId === instanceId && !removedCard) {
-        removedCard = card;
-      } else {
-        filtered.push(card);
-      }
+  instanceId: InstanceId,
+  update: (card: CardInstance) => CardInstance | null
+): { location: LocationState; card: CardInstance; playerId: PlayerId; index: number } | null {
+  for (const playerId of BOTH_PLAYERS) {
+    const cards = location.cardsByPlayer[playerId];
+    const index = cards.findIndex(c => c.instanceId === instanceId);
+    if (index === -1) continue;
+
+    const card = cards[index]!;
+    const updated = update(card);
+    const newCards = [...cards];
+    if (updated === null) {
+      newCards.splice(index, 1);
+    } else {
+      newCards[index] = updated;
     }
-    newCardsByPlayer[playerId] = filtered;
+    const other = location.cardsByPlayer[getOpponentId(playerId)];
+    return {
+      location: {
+        ...location,
+        cardsByPlayer: playerId === 0 ? [newCards, other] : [other, newCards],
+      },
+      card,
+      playerId,
+      index,
+    };
   }
+  return null;
+}
 
-  return [{ ...location, cardsByPlayer: newCardsByPlayer }, removedCard];
+/**
+ * Remove a card from this location.
+ * The location is returned unchanged (with a null card) if the card is not here.
+ */
+export function removeCard(
+  location: LocationState,
+  instanceId: InstanceId
+): [LocationState, CardInstance | null] {
+  const result = withSideCard(location, instanceId, () => null);
+  return result ? [result.location, result.card] : [location, null];
 }
 
-/** Update a card in this location */
+/**
+ * Update a card in this location.
+ * The location is returned unchanged if the card is not here.
+ */
 export function updateCard(location: LocationState, updatedCard: CardInstance): LocationState {
-  const newCardsByPlayer: [readonly CardInstance[], readonly CardInstance[]] = [
-    location.cardsByPlayer[0].map(c =>
-      c.instanceId === updatedCard.instanceId ? updatedCard : c
-    ),
-    location.cardsByPlayer[1].map(c =>
-      c.instanceId === updatedCard.instanceId ? updatedCard : c
-    ),
-  ];
-  return { ...location, cardsByPlayer: newCardsByPlayer };
+  return withSideCard(location, updatedCard.instanceId, () => updatedCard)?.location ?? location;
+}
+
+/**
+ * Add permanent power to a card at this location.
+ * Returns null if the card is not here.
+ */
+export function addCardPermanentPowerAt(
+  location: LocationState,
+  instanceId: InstanceId,
+  amount: Power
+): { location: LocationState; oldPower: Power; newPower: Power } | null {
+  const result = withSideCard(location, instanceId, card => addPermanentPower(card, amount));
+  if (!result) return null;
+  const updated = result.location.cardsByPlayer[result.playerId][result.index]!;
+  return {
+    location: result.location,
+    oldPower: getEffectivePower(result.card),
+    newPower: getEffectivePower(updated),
+  };
+}
+
+/**
+ * Add ongoing power to a card at this location.
+ * Returns null if the card is not here.
+ */
+export function addCardOngoingPowerAt(
+  location: LocationState,
+  instanceId: InstanceId,
+  amount: Power
+): LocationState | null {
+  return withSideCard(
+    location,
+    instanceId,
+    card => withOngoingPower(card, card.ongoingPowerModifier + amount)
+  )?.location ?? null;
 }
 
 /** Calculate total power at this location for a player */
@@ -355,30 +433,66 @@ export interface ActiveEffect {
 
 // State update helpers
 export function withPlayer(state: GameState, playerId: PlayerId, player: PlayerState): GameState {
+  if (state.players[playerId] === player) return state;
   const players: [PlayerState, PlayerState] = [...state.players] as [PlayerState, PlayerState];
   players[playerId] = player;
   return { ...state, players };
 }
 
 export function withLocation(state: GameState, index: LocationIndex, location: LocationState): GameState {
+  if (state.locations[index] === location) return state;
   const locations: [LocationState, LocationState, LocationState] = [...state.locations] as [LocationState, LocationState, LocationState];
   locations[index] = location;
   return { ...state, locations };
 }
 
+/**
+ * Add permanent power to a card on the board in one step.
+ * Returns the effective power before and after so callers can emit
+ * PowerChanged directly, or null if the card is not on the board.
+ */
+export function addCardPermanentPower(
+  state: GameState,
+  instanceId: InstanceId,
+  amount: Power
+): { state: GameState; oldPower: Power; newPower: Power } | null {
+  for (const location of state.locations) {
+    const result = addCardPermanentPowerAt(location, instanceId, amount);
+    if (result) {
+      return {
+        state: withLocation(state, location.index, result.location),
+        oldPower: result.oldPower,
+        newPower: result.newPower,
+      };
+    }
+  }
+  return null;
+}
+
+/** Replace all three locations in one update */
+export function withLocations(state: GameState, locations: LocationTuple<LocationState>): GameState {
+  if (locations.every((loc, i) => loc === state.locations[i])) return state;
+  return { ...state, locations: [locations[0], locations[1], locations[2]] };
+}
+
+// Scalar updaters return the same state when the value is unchanged
 export function withTurn(state: GameState, turn: TurnNumber): GameState {
+  if (state.turn === turn) return state;
   return { ...state, turn };
 }
 
 export function withPhase(state: GameState, phase: GamePhase): GameState {
+  if (state.phase === phase) return state;
   return { ...state, phase };
 }
 
 export function withResult(state: GameState, result: GameResult): GameState {
+  if (state.result === result) return state;
   return { ...state, result };
 }
 
 export function withNextInstanceId(state: GameState, nextId: InstanceId): GameState {
+  if (state.nextInstanceId === nextId) return state;
   return { ...state, nextInstanceId: nextId };
 }
 
@@ -386,6 +500,11 @@ export function withCardDestroyed(state: GameState, instanceId: InstanceId): Gam
   return { ...state, cardsDestroyedThisGame: [...state.cardsDestroyedThisGame, instanceId] };
 }
 
+export function withCardsDestroyed(state: GameState, instanceIds: readonly InstanceId[]): GameState {
+  if (instanceIds.length === 0) return state;
+  return { ...state, cardsDestroyedThisGame: [...state.cardsDestroyedThisGame, ...instanceIds] };
+}
+
 export function withCardMoved(state: GameState, instanceId: InstanceId): GameState {
   return {
     ...state,
@@ -399,7 +518,17 @@ export function withSilencedCard(state: GameState, instanceId: InstanceId): Game
   return { ...state, silencedCards: [...state.silencedCards, instanceId] };
 }
 
+export function withSilencedCards(state: GameState, instanceIds: readonly InstanceId[]): GameState {
+  const added: InstanceId[] = [];
+  for (const id of instanceIds) {
+    if (!state.silencedCards.includes(id) && !added.includes(id)) added.push(id);
+  }
+  if (added.length === 0) return state;
+  return { ...state, silencedCards: [...state.silencedCards, ...added] };
+}
+
 export function clearTurnTracking(state: GameState): GameState {
+  if (state.cardsMovedThisTurn.length === 0) return state;
   return { ...state, cardsMovedThisTurn: [] };
 }
 
@@ -455,10 +584,12 @@ export function expireEffectsAtTurnStart(state: GameState): GameState {
 }
 
 export function withRngSeed(state: GameState, seed: number): GameState {
+  if (state.rngSeed === seed) return state;
   return { ...state, rngSeed: seed };
 }
 
 export function withActivePlayer(state: GameState, playerId: PlayerId): GameState {
+  if (state.activePlayerThisTurn === playerId) return state;
   return { ...state, activePlayerThisTurn: playerId };
 }
 
@@ -471,15 +602,31 @@ export function getLocation(state: GameState, index: LocationIndex): LocationSta
   return state.locations[index];
 }
 
-export function findCardLocation(state: GameState, instanceId: InstanceId): LocationIndex | null {
+/** A card on the board together with the location it is at */
+export interface LocatedCard {
+  readonly card: CardInstance;
+  readonly location: LocationIndex;
+}
+
+/**
+ * Find a card on the board and its location in a single walk.
+ * Use this instead of findCardByInstance + findCardLocation when both are needed.
+ */
+export function locateCard(state: GameState, instanceId: InstanceId): LocatedCard | null {
   for (const location of state.locations) {
-    for (const card of getAllCards(location)) {
-      if (card.instanceId === instanceId) return location.index;
+    for (const cards of location.cardsByPlayer) {
+      for (const card of cards) {
+        if (card.instanceId === instanceId) return { card, location: location.index };
+      }
     }
   }
   return null;
 }
 
+export function findCardLocation(state: GameState, instanceId: InstanceId): LocationIndex | null {
+  return locateCard(state, instanceId)?.location ?? null;
+}
+
 export function findCardByInstance(state: GameState, instanceId: InstanceId): CardInstance | null {
   // Check hands
   for (const player of state.players) {
@@ -8,26 +8,23 @@
  * It does NOT make decisions - all decisions were made during generation.
  */
 
-import type { GameState, CardInstance } from '../models';
+import type { GameState, CardInstance, LocationState } from '../models';
 import type { GameEvent } from '../events';
-import type { LocationIndex, PlayerId, InstanceId } from '../types';
+import type { LocationIndex, InstanceId } from '../types';
 import { SeededRNG } from '../rng';
 import {
   getLocation,
   withLocation,
   withPhase,
   getCards,
-  getAllCards,
   updateCard,
   withRevealed,
   withOngoingPower,
-  isSilenced,
-  withSilencedCard,
-  findCardByInstance,
-  findCardLocation,
+  withSilencedCards,
+  locateCard,
   getCardCount,
 } from '../models';
-import { LOCATION_CAPACITY } from '../types';
+import { LOCATION_CAPACITY, getOpponentId } from '../types';
 import { applyEffect, applyOngoingPowerModification } from '../ability/effects';
 import { evaluateCondition } from '../ability/conditions';
 import { resolveTargets } from '../ability/selectors';
@@ -148,12 +145,12 @@ function executeRevealStep(
   }
   
   const cardId = step.source.id as InstanceId;
-  const card = findCardByInstance(newState, cardId);
-  const location = findCardLocation(newState, cardId);
+  const located = locateCard(newState, cardId);
   
-  if (!card || location === null) {
+  if (!located) {
     return { state: newState, events };
   }
+  const { card, location } = located;
   
   // Reveal the card
   const revealedCard = withRevealed(card, true);
@@ -179,16 +176,16 @@ function executeEventStep(
   step: Step,
   rng: SeededRNG
 ): { state: GameState; events: GameEvent[] } {
-  const result = applyEffect(state, step, rng);
-  
-  // Add ability triggered event
+  // Add ability triggered event, then let the effect append after it
   const events: GameEvent[] = [{
     type: 'AbilityTriggered' as const,
     sourceCardId: step.source.id as InstanceId,
     trigger: step.trigger,
     targets: [...step.targets],
     effect: step.effect,
-  } as GameEvent, ...result.events];
+  } as GameEvent];
+  
+  const result = applyEffect(state, step, rng, events);
   
   return {
     state: result.state,
@@ -210,15 +207,49 @@ function executeOngoingRecalcStep(
   let newState = state;
   const events: GameEvent[] = [];
   
-  // Track old effective power for all cards BEFORE any changes
+  // Steps 1-2: Reset all ongoing power modifiers to 0 and clear silenced
+  // cards (silence is reapplied fresh), committed as one state update
+  const resetLocations: [LocationState, LocationState, LocationState] = [
+    resetOngoingPower(newState.locations[0]),
+    resetOngoingPower(newState.locations[1]),
+    resetOngoingPower(newState.locations[2]),
+  ];
+  newState = { ...newState, locations: resetLocations, silencedCards: [] };
+  
+  // Collect revealed ONGOING cards once; silence only touches silencedCards,
+  // so the same cards and locations serve both passes below
+  const ongoingCards: { card: CardInstance; location: LocationState }[] = [];
+  for (const location of newState.locations) {
+    for (const cards of location.cardsByPlayer) {
+      for (const card of cards) {
+        if (card.revealed && card.cardDef.abilityType === 'ONGOING') {
+          ongoingCards.push({ card, location });
+        }
+      }
+    }
+  }
+  
+  // Nothing can silence or buff: the reset is the whole result. Step 5 would
+  // emit nothing either, since PowerChanged needs an ongoing source card.
+  if (ongoingCards.length === 0) {
+    return { state: newState, events };
+  }
+  
+  // Track old effective power for all cards from the incoming state (before the reset)
   // Map: instanceId -> { oldPower, oldOngoingPower }
   const oldPowerMap = new Map<InstanceId, { oldPower: number; oldOngoingPower: number }>();
+  // Ongoing recalculation never moves cards, so one location index serves
+  // every ongoing power update below
+  const cardLocations = new Map<InstanceId, LocationIndex>();
   for (const location of state.locations) {
-    for (const card of getAllCards(location)) {
-      oldPowerMap.set(card.instanceId, {
-        oldPower: card.cardDef.basePower + card.permanentPowerModifier + card.ongoingPowerModifier,
-        oldOngoingPower: card.ongoingPowerModifier,
-      });
+    for (const cards of location.cardsByPlayer) {
+      for (const card of cards) {
+        oldPowerMap.set(card.instanceId, {
+          oldPower: card.cardDef.basePower + card.permanentPowerModifier + card.ongoingPowerModifier,
+          oldOngoingPower: card.ongoingPowerModifier,
+        });
+        cardLocations.set(card.instanceId, location.index);
+      }
     }
   }
   
@@ -226,148 +257,120 @@ function executeOngoingRecalcStep(
   // Map: targetId -> sourceId (the card providing the ongoing buff)
   const ongoingSourceMap = new Map<InstanceId, InstanceId>();
   
-  // Step 1: Reset all ongoing power modifiers to 0
-  for (let locIdx = 0; locIdx < 3; locIdx++) {
-    let loc = getLocation(newState, locIdx as LocationIndex);
-    const newCardsByPlayer: [readonly CardInstance[], readonly CardInstance[]] = [
-      loc.cardsByPlayer[0].map(c => withOngoingPower(c, 0)),
-      loc.cardsByPlayer[1].map(c => withOngoingPower(c, 0)),
-    ];
-    loc = { ...loc, cardsByPlayer: newCardsByPlayer };
-    newState = withLocation(newState, locIdx as LocationIndex, loc);
-  }
-  
-  // Step 2: Clear silenced cards (silence is reapplied fresh)
-  newState = { ...newState, silencedCards: [] };
-  
   // Step 3: Apply silence effects first (using ability system)
-  for (const location of newState.locations) {
-    for (const card of getAllCards(location)) {
-      if (!card.revealed || card.cardDef.abilityType !== 'ONGOING') continue;
-      
-      // Parse ONGOING abilities for this card
-      const abilities = parseCardAbilities(card, 'ONGOING');
-      
-      for (const ability of abilities) {
-        if (ability.effect === 'SILENCE_ENEMY_ONGOING_HERE') {
-          // Apply silence to all enemies at this location
-          const enemyPlayer = (1 - card.owner) as PlayerId;
-          const enemies = getCards(location, enemyPlayer);
-          for (const enemy of enemies) {
-            newState = withSilencedCard(newState, enemy.instanceId);
-          }
-        }
+  for (const { card, location } of ongoingCards) {
+    // Parse ONGOING abilities for this card
+    const abilities = parseCardAbilities(card, 'ONGOING');
+    
+    for (const ability of abilities) {
+      if (ability.effect === 'SILENCE_ENEMY_ONGOING_HERE') {
+        // Apply silence to all enemies at this location
+        const enemyPlayer = getOpponentId(card.owner);
+        const enemies = getCards(location, enemyPlayer);
+        newState = withSilencedCards(newState, enemies.map(enemy => enemy.instanceId));
       }
     }
   }
   
+  // Silence is fixed from here on; a Set makes the per-card check O(1)
+  const silenced = new Set(newState.silencedCards);
+  
   // Step 4: Apply ongoing power effects (respecting silence, using ability system)
-  for (const location of newState.locations) {
-    for (const card of getAllCards(location)) {
-      if (!card.revealed || card.cardDef.abilityType !== 'ONGOING') continue;
-      if (isSilenced(newState, card.instanceId)) continue;
+  for (const { card, location } of ongoingCards) {
+    if (silenced.has(card.instanceId)) continue;
+    
+    // Parse ONGOING abilities for this card
+    const abilities = parseCardAbilities(card, 'ONGOING');
+    
+    for (const ability of abilities) {
+      // Skip silence effects (already handled)
+      if (ability.effect === 'SILENCE_ENEMY_ONGOING_HERE') continue;
       
-      // Parse ONGOING abilities for this card
-      const abilities = parseCardAbilities(card, 'ONGOING');
+      // Evaluate condition
+      if (!evaluateCondition(ability.condition, newState, card, location.index)) {
+        continue;
+      }
       
-      for (const ability of abilities) {
-        // Skip silence effects (already handled)
-        if (ability.effect === 'SILENCE_ENEMY_ONGOING_HERE') continue;
-        
-        // Evaluate condition
-        if (!evaluateCondition(ability.condition, newState, card, location.index)) {
-          continue;
-        }
-        
-        // Handle different effect types
-        if (ability.effect === 'BUFF_ALLIES_HERE' || ability.effect === 'DEBUFF_ENEMIES_HERE') {
-          // Check if this is a scaling effect (has perUnitAmount parameter)
-          if (ability.parameters?.perUnitAmount !== undefined && ability.parameters?.countFilter) {
-            // Scaling ongoing effect (e.g., Dionysus)
-            let count = 0;
-            
-            // Count based on countFilter
-            if (ability.parameters.countFilter === 'LOCATION') {
-              // Count empty slots for Dionysus
-              const allyCount = getCardCount(location, card.owner);
-              count = LOCATION_CAPACITY - allyCount;
-            } else {
-              // Use target resolver for other count filters
-              const countTargets = resolveTargets(
-                ability.parameters.countFilter as import('../ability/types').TargetSelector,
-                newState,
-                card,
-                location.index,
-                rng
-              );
-              count = countTargets.length;
-            }
-            
-            const bonus = count * ability.parameters.perUnitAmount;
-            
-            if (bonus !== 0) {
-              const targets = resolveTargets(ability.targetSelector, newState, card, location.index, rng);
-              // Track which source card is providing the ongoing buff
-              for (const targetId of targets) {
-                // Only track if source is different from target (for animation purposes)
-                if (targetId !== card.instanceId) {
-                  ongoingSourceMap.set(targetId, card.instanceId);
-                }
-              }
-              newState = applyOngoingPowerModification(newState, targets, bonus);
-            }
+      // Work out the amount; all ongoing power effects share the apply path
+      let amount: number;
+      let targets: readonly InstanceId[] | null = null;
+      
+      if (ability.effect === 'BUFF_ALLIES_HERE' || ability.effect === 'DEBUFF_ENEMIES_HERE') {
+        // Check if this is a scaling effect (has perUnitAmount parameter)
+        if (ability.parameters?.perUnitAmount !== undefined && ability.parameters?.countFilter) {
+          // Scaling ongoing effect (e.g., Dionysus)
+          const countFilter = ability.parameters.countFilter as import('../ability/types').TargetSelector;
+          let count = 0;
+          
+          // Count based on countFilter
+          if (countFilter === 'LOCATION') {
+            // Count empty slots for Dionysus
+            const allyCount = getCardCount(location, card.owner);
+            count = LOCATION_CAPACITY - allyCount;
           } else {
-            // Simple ongoing power effect
-            const targets = resolveTargets(ability.targetSelector, newState, card, location.index, rng);
-            // Track which source card is providing the ongoing buff
-            for (const targetId of targets) {
-              // Only track if source is different from target (for animation purposes)
-              if (targetId !== card.instanceId) {
-                ongoingSourceMap.set(targetId, card.instanceId);
-              }
-            }
-            newState = applyOngoingPowerModification(newState, targets, ability.value);
-          }
-        } else if (ability.effect === 'BUFF_DESTROY_CARDS_GLOBAL') {
-          // Global ongoing buff for destroy-tagged cards (Underworld Gate)
-          const targets = resolveTargets(ability.targetSelector, newState, card, location.index, rng);
-          // Track which source card is providing the ongoing buff
-          for (const targetId of targets) {
-            if (targetId !== card.instanceId) {
-              ongoingSourceMap.set(targetId, card.instanceId);
+            // Use target resolver for other count filters
+            const countTargets = resolveTargets(countFilter, newState, card, location.index, rng);
+            count = countTargets.length;
+            // Counting and targeting the same (deterministic) set resolves it once
+            if (countFilter === ability.targetSelector && countFilter !== 'RANDOM_VALID_TARGET') {
+              targets = countTargets;
             }
           }
-          newState = applyOngoingPowerModification(newState, targets, ability.value);
+          
+          amount = count * ability.parameters.perUnitAmount;
+          if (amount === 0) continue;
+        } else {
+          // Simple ongoing power effect
+          amount = ability.value;
+        }
+      } else if (ability.effect === 'BUFF_DESTROY_CARDS_GLOBAL') {
+        // Global ongoing buff for destroy-tagged cards (Underworld Gate)
+        amount = ability.value;
+      } else {
+        continue;
+      }
+      
+      if (!targets) {
+        targets = resolveTargets(ability.targetSelector, newState, card, location.index, rng);
+      }
+      // Track which source card is providing the ongoing buff
+      for (const targetId of targets) {
+        // Only track if source is different from target (for animation purposes)
+        if (targetId !== card.instanceId) {
+          ongoingSourceMap.set(targetId, card.instanceId);
         }
       }
+      newState = applyOngoingPowerModification(newState, targets, amount, cardLocations);
     }
   }
   
   // Step 5: Emit PowerChangedEvent for cards whose ongoing power changed
   // Only emit events where source != target (these trigger animations)
   for (const location of newState.locations) {
-    for (const card of getAllCards(location)) {
-      const oldData = oldPowerMap.get(card.instanceId);
-      if (!oldData) continue;
-      
-      const newPower = card.cardDef.basePower + card.permanentPowerModifier + card.ongoingPowerModifier;
-      const oldPower = oldData.oldPower;
-      
-      // Check if effective power changed due to ongoing effects
-      if (newPower !== oldPower) {
-        // Get the source card that caused this change
-        const sourceCardId = ongoingSourceMap.get(card.instanceId);
+    for (const cards of location.cardsByPlayer) {
+      for (const card of cards) {
+        const oldData = oldPowerMap.get(card.instanceId);
+        if (!oldData) continue;
         
-        // Only emit if we have a source and it's different from the target
-        // This matches the filter in gameStore that triggers animations
-        if (sourceCardId !== undefined && sourceCardId !== card.instanceId) {
-          events.push({
-            type: 'PowerChanged',
-            cardInstanceId: card.instanceId,
-            oldPower,
-            newPower,
-            sourceCardId,
-          });
+        const newPower = card.cardDef.basePower + card.permanentPowerModifier + card.ongoingPowerModifier;
+        const oldPower = oldData.oldPower;
+        
+        // Check if effective power changed due to ongoing effects
+        if (newPower !== oldPower) {
+          // Get the source card that caused this change
+          const sourceCardId = ongoingSourceMap.get(card.instanceId);
+          
+          // Only emit if we have a source and it's different from the target
+          // This matches the filter in gameStore that triggers animations
+          if (sourceCardId !== undefined && sourceCardId !== card.instanceId) {
+            events.push({
+              type: 'PowerChanged',
+              cardInstanceId: card.instanceId,
+              oldPower,
+              newPower,
+              sourceCardId,
+            });
+          }
         }
       }
     }
@@ -376,6 +379,26 @@ function executeOngoingRecalcStep(
   return { state: newState, events };
 }
 
+/**
+ * Reset the ongoing power modifier of every card at a location to 0.
+ * Cards already at 0 are kept as-is, and the location itself is returned
+ * unchanged when no card needed a reset.
+ */
+function resetOngoingPower(location: LocationState): LocationState {
+  const needsReset = (c: CardInstance) => c.ongoingPowerModifier !== 0;
+  if (!location.cardsByPlayer[0].some(needsReset) && !location.cardsByPlayer[1].some(needsReset)) {
+    return location;
+  }
+  const reset = (c: CardInstance) => (needsReset(c) ? withOngoingPower(c, 0) : c);
+  return {
+    ...location,
+    cardsByPlayer: [
+      location.cardsByPlayer[0].map(reset),
+      location.cardsByPlayer[1].map(reset),
+    ],
+  };
+}
+
 /**
  * Execute a CLEANUP step.
  * This expires temporary effects and prepares for next turn.
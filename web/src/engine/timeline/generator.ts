@@ -9,14 +9,14 @@
  * Same inputs (state + playedCards + seed) = identical timeline.
  */
 
-import type { GameState, CardInstance } from '../models';
+import type { GameState, CardInstance, CardDef } from '../models';
 import type { LocationIndex, PlayerId, TurnNumber } from '../types';
 import { SeededRNG } from '../rng';
-import { findCardByInstance } from '../models';
+import { findCardByInstance, getCards, getLocation } from '../models';
 import type { Ability } from '../ability/ability';
 import { evaluateCondition } from '../ability/conditions';
 import { resolveTargets } from '../ability/selectors';
-import type { Trigger, EffectType } from '../ability/types';
+import type { Trigger, EffectType, TargetSelector, Condition } from '../ability/types';
 import type {
   Step,
   PlayedCard,
@@ -63,7 +63,7 @@ export function generateTimeline(
   // Phase 1: Generate REVEAL steps
   // ==========================================================================
   for (const playedCard of sortedCards) {
-    const card = findCardByInstance(state, playedCard.instanceId);
+    const card = findPlayedCard(state, playedCard);
     if (!card) continue;
     
     // Create reveal step
@@ -109,6 +109,20 @@ export function generateTimeline(
   };
 }
 
+/**
+ * Look up a played card on the board.
+ * 
+ * Played cards are already placed at their location, so check that
+ * location's side first instead of scanning every hand and deck.
+ */
+function findPlayedCard(state: GameState, playedCard: PlayedCard): CardInstance | null {
+  const cards = getCards(getLocation(state, playedCard.location), playedCard.playerId);
+  for (const card of cards) {
+    if (card.instanceId === playedCard.instanceId) return card;
+  }
+  return findCardByInstance(state, playedCard.instanceId);
+}
+
 // =============================================================================
 // Reveal Order Sorting
 // =============================================================================
@@ -226,6 +240,13 @@ function generateAbilitySteps(
   return steps;
 }
 
+/**
+ * Parsed abilities per card definition and trigger.
+ * Card definitions are immutable, so the mapping is done once per definition
+ * instead of on every reveal and every ongoing recalculation.
+ */
+const abilityCache = new WeakMap<CardDef, Map<Trigger, readonly Ability[]>>();
+
 /**
  * Parse card effects into the new Ability format.
  * This bridges the legacy effect system with the new ability system.
@@ -236,10 +257,28 @@ function generateAbilitySteps(
  * 2. Self-destroy effects happen last
  * This ensures cards like Shade can buff allies before destroying themselves.
  */
-export function parseCardAbilities(card: CardInstance, trigger: Trigger): Ability[] {
+export function parseCardAbilities(card: CardInstance, trigger: Trigger): readonly Ability[] {
+  let byTrigger = abilityCache.get(card.cardDef);
+  if (!byTrigger) {
+    byTrigger = new Map();
+    abilityCache.set(card.cardDef, byTrigger);
+  }
+  
+  let abilities = byTrigger.get(trigger);
+  if (!abilities) {
+    abilities = mapCardAbilities(card.cardDef, trigger);
+    byTrigger.set(trigger, abilities);
+  }
+  return abilities;
+}
+
+/**
+ * Map a card definition's legacy effects to abilities, DESTROY_SELF last.
+ */
+function mapCardAbilities(cardDef: CardDef, trigger: Trigger): readonly Ability[] {
   const abilities: Ability[] = [];
   
-  for (const effect of card.cardDef.effects) {
+  for (const effect of cardDef.effects) {
     // Map legacy effects to new abilities (cast to Record to satisfy type system)
     const ability = mapLegacyEffectToAbility(effect as unknown as Record<string, unknown>, trigger);
     if (ability) {
@@ -610,78 +649,79 @@ function mapLegacyEffectToAbility(
   }
 }
 
+/** Legacy target filter -> TargetSelector */
+const TARGET_FILTER_MAP: Readonly<Record<string, TargetSelector>> = {
+  'SELF': 'SELF',
+  // SAME_LOCATION_FRIENDLY includes self - used by cards that say "your cards here"
+  'SAME_LOCATION_FRIENDLY': 'ALL_ALLIES_HERE',
+  // SAME_LOCATION_FRIENDLY_EXCEPT_SELF excludes self - used by cards that say "other cards here"
+  'SAME_LOCATION_FRIENDLY_EXCEPT_SELF': 'ALL_ALLIES_HERE_EXCEPT_SELF',
+  // SAME_LOCATION_FRIENDLY_ARMY_EXCEPT_SELF targets Army-type cards except self (Kouretes)
+  'SAME_LOCATION_FRIENDLY_ARMY_EXCEPT_SELF': 'ALLIES_HERE_ARMY_EXCEPT_SELF',
+  'SAME_LOCATION_ENEMY': 'ALL_ENEMIES_HERE',
+  // ONE_SAME_LOCATION_FRIENDLY always excludes self (picks ONE other ally)
+  'ONE_SAME_LOCATION_FRIENDLY': 'ONE_OTHER_ALLY_HERE',
+  'ONE_SAME_LOCATION_FRIENDLY_EXCEPT_SELF': 'ONE_OTHER_ALLY_HERE',
+  'ONE_SAME_LOCATION_ENEMY': 'ONE_ENEMY_HERE',
+  'ALL_FRIENDLY': 'ALL_ALLIES_HERE',
+  'ALL_ENEMY': 'ALL_ENEMIES_HERE',
+  'OTHER_LOCATIONS_FRIENDLY': 'ALL_ALLIES_OTHER_LOCATIONS',
+  'ONE_OTHER_LOCATION_FRIENDLY': 'ONE_ALLY_OTHER_LOCATION',
+  'HIGHEST_POWER_ENEMY_HERE': 'HIGHEST_POWER_ENEMY_HERE',
+  'SAME_LOCATION_ENEMY_BUFF_TAGGED': 'ENEMY_WITH_BUFF_TAG_HERE',
+  'SAME_LOCATION_ENEMY_ONGOING': 'ENEMY_WITH_ONGOING_HERE',
+  'ONE_OTHER_LOCATION_FRIENDLY_TO_HERE': 'ONE_ALLY_OTHER_LOCATION',
+  'ALL_FRIENDLY_DESTROY_TAGGED': 'FRIENDLY_WITH_DESTROY_TAG',
+  'ONE_DESTINATION_ENEMY': 'ONE_ENEMY_AT_DESTINATION',
+  'MOVED_CARD': 'MOVED_CARD', // Keep as special marker - the moved card becomes the buff target
+  // Empty slot counting for Dionysus
+  'EMPTY_SLOTS_HERE': 'LOCATION',
+};
+
 /**
  * Map legacy target filter to new TargetSelector.
  */
-function mapTargetFilter(target: string | undefined): import('../ability/types').TargetSelector {
+function mapTargetFilter(target: string | undefined): TargetSelector {
   if (!target) return 'SELF';
-  
-  const mapping: Record<string, import('../ability/types').TargetSelector> = {
-    'SELF': 'SELF',
-    // SAME_LOCATION_FRIENDLY includes self - used by cards that say "your cards here"
-    'SAME_LOCATION_FRIENDLY': 'ALL_ALLIES_HERE',
-    // SAME_LOCATION_FRIENDLY_EXCEPT_SELF excludes self - used by cards that say "other cards here"
-    'SAME_LOCATION_FRIENDLY_EXCEPT_SELF': 'ALL_ALLIES_HERE_EXCEPT_SELF',
-    // SAME_LOCATION_FRIENDLY_ARMY_EXCEPT_SELF targets Army-type cards except self (Kouretes)
-    'SAME_LOCATION_FRIENDLY_ARMY_EXCEPT_SELF': 'ALLIES_HERE_ARMY_EXCEPT_SELF',
-    'SAME_LOCATION_ENEMY': 'ALL_ENEMIES_HERE',
-    // ONE_SAME_LOCATION_FRIENDLY always excludes self (picks ONE other ally)
-    'ONE_SAME_LOCATION_FRIENDLY': 'ONE_OTHER_ALLY_HERE',
-    'ONE_SAME_LOCATION_FRIENDLY_EXCEPT_SELF': 'ONE_OTHER_ALLY_HERE',
-    'ONE_SAME_LOCATION_ENEMY': 'ONE_ENEMY_HERE',
-    'ALL_FRIENDLY': 'ALL_ALLIES_HERE',
-    'ALL_ENEMY': 'ALL_ENEMIES_HERE',
-    'OTHER_LOCATIONS_FRIENDLY': 'ALL_ALLIES_OTHER_LOCATIONS',
-    'ONE_OTHER_LOCATION_FRIENDLY': 'ONE_ALLY_OTHER_LOCATION',
-    'HIGHEST_POWER_ENEMY_HERE': 'HIGHEST_POWER_ENEMY_HERE',
-    'SAME_LOCATION_ENEMY_BUFF_TAGGED': 'ENEMY_WITH_BUFF_TAG_HERE',
-    'SAME_LOCATION_ENEMY_ONGOING': 'ENEMY_WITH_ONGOING_HERE',
-    'ONE_OTHER_LOCATION_FRIENDLY_TO_HERE': 'ONE_ALLY_OTHER_LOCATION',
-    'ALL_FRIENDLY_DESTROY_TAGGED': 'FRIENDLY_WITH_DESTROY_TAG',
-    'ONE_DESTINATION_ENEMY': 'ONE_ENEMY_AT_DESTINATION',
-    'MOVED_CARD': 'MOVED_CARD', // Keep as special marker - the moved card becomes the buff target
-    // Empty slot counting for Dionysus
-    'EMPTY_SLOTS_HERE': 'LOCATION',
-  };
-  
-  return mapping[target] ?? 'SELF';
+  return TARGET_FILTER_MAP[target] ?? 'SELF';
 }
 
+/** Legacy condition -> Condition */
+const CONDITION_MAP: Readonly<Record<string, Condition>> = {
+  'location_full': 'CONDITIONAL_LOCATION_FULL',
+  'only_card_here': 'CONDITIONAL_ONLY_CARD_HERE',
+  'destroyed_this_game': 'CONDITIONAL_DESTROYED_THIS_GAME',
+  'moved_this_game': 'CONDITIONAL_MOVED_THIS_GAME',
+  'moved_this_turn': 'CONDITIONAL_MOVED_BY_YOU_THIS_TURN',
+  'has_empty_slot': 'CONDITIONAL_EMPTY_SLOT_HERE',
+  'empty_slot_here': 'CONDITIONAL_EMPTY_SLOT_HERE',
+  'exactly_one_other_ally_here': 'CONDITIONAL_EXACTLY_ONE_OTHER_ALLY_HERE',
+  'exactly_two_allies_here': 'CONDITIONAL_EXACTLY_TWO_ALLIES_HERE',
+  'enemy_more_cards_here': 'CONDITIONAL_ENEMY_MORE_CARDS_HERE',
+  'enemy_highest_power_here': 'CONDITIONAL_ENEMY_HIGHEST_POWER_HERE',
+  'enemy_3plus_here': 'CONDITIONAL_ENEMY_3PLUS_HERE',
+  'losing_location': 'CONDITIONAL_LOSING_LOCATION',
+};
+
 /**
  * Map legacy condition to new Condition.
  */
-function mapCondition(condition: string | undefined): import('../ability/types').Condition {
+function mapCondition(condition: string | undefined): Condition {
   if (!condition) return 'NONE';
-  
-  const mapping: Record<string, import('../ability/types').Condition> = {
-    'location_full': 'CONDITIONAL_LOCATION_FULL',
-    'only_card_here': 'CONDITIONAL_ONLY_CARD_HERE',
-    'destroyed_this_game': 'CONDITIONAL_DESTROYED_THIS_GAME',
-    'moved_this_game': 'CONDITIONAL_MOVED_THIS_GAME',
-    'moved_this_turn': 'CONDITIONAL_MOVED_BY_YOU_THIS_TURN',
-    'has_empty_slot': 'CONDITIONAL_EMPTY_SLOT_HERE',
-    'empty_slot_here': 'CONDITIONAL_EMPTY_SLOT_HERE',
-    'exactly_one_other_ally_here': 'CONDITIONAL_EXACTLY_ONE_OTHER_ALLY_HERE',
-    'exactly_two_allies_here': 'CONDITIONAL_EXACTLY_TWO_ALLIES_HERE',
-    'enemy_more_cards_here': 'CONDITIONAL_ENEMY_MORE_CARDS_HERE',
-    'enemy_highest_power_here': 'CONDITIONAL_ENEMY_HIGHEST_POWER_HERE',
-    'enemy_3plus_here': 'CONDITIONAL_ENEMY_3PLUS_HERE',
-    'losing_location': 'CONDITIONAL_LOSING_LOCATION',
-  };
-  
-  return mapping[condition] ?? 'NONE';
+  return CONDITION_MAP[condition] ?? 'NONE';
 }
 
+/** Effect types that resolve without targets */
+const NO_TARGET_EFFECTS: ReadonlySet<EffectType> = new Set<EffectType>([
+  'ADD_ENERGY_NEXT_TURN',
+  'SUMMON_SPIRIT',
+]);
+
 /**
  * Check if an effect type requires targets.
  */
 function requiresTargets(effect: EffectType): boolean {
-  const noTargetEffects: EffectType[] = [
-    'ADD_ENERGY_NEXT_TURN',
-    'SUMMON_SPIRIT',
-  ];
-  
-  return !noTargetEffects.includes(effect);
+  return !NO_TARGET_EFFECTS.has(effect);
 }
 
 // =============================================================================
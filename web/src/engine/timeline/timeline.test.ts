@@ -13,9 +13,10 @@ import { SeededRNG } from '../rng';
 import { generateTimeline, compareTimelines } from './generator';
 import { executeTimeline, createStepIterator } from './executor';
 import type { PlayedCard, Step } from './types';
-import { verifyTimelineIntegrity, getStepsByPhase } from './types';
+import { verifyTimelineIntegrity, getStepsByPhase, createOngoingRecalcStep } from './types';
 import type { GameState, CardInstance, PlayerState } from '../models';
 import { createInitialLocations, addCard, withLocation, withPhase } from '../models';
+import type { Effect } from '../effects';
 import type { LocationIndex, PlayerId, TurnNumber } from '../types';
 
 // =============================================================================
@@ -67,6 +68,26 @@ function createTestGameState(turn: TurnNumber = 1): GameState {
   };
 }
 
+function createOngoingCard(
+  instanceId: number,
+  owner: PlayerId,
+  basePower: number,
+  effects: Effect[]
+): CardInstance {
+  const card = createTestCardInstance(instanceId, owner, `ongoing_${instanceId}`, basePower, 'ONGOING');
+  return { ...card, cardDef: { ...card.cardDef, effects }, revealed: true };
+}
+
+function findCard(state: GameState, instanceId: number): CardInstance | undefined {
+  for (const location of state.locations) {
+    for (const cards of location.cardsByPlayer) {
+      const card = cards.find(c => c.instanceId === instanceId);
+      if (card) return card;
+    }
+  }
+  return undefined;
+}
+
 function placeCardAtLocation(
   state: GameState,
   card: CardInstance,
@@ -431,3 +452,75 @@ describe('compareTimelines', () => {
     expect(result.differences.length).toBeGreaterThan(0);
   });
 });
+
+describe('ONGOING_RECALC', () => {
+  it('clears stale ongoing buffs when no ONGOING card is left on the board', () => {
+    // The ally kept +2 from an ONGOING source that has since left the board
+    const ally = { ...createTestCardInstance(1, 0, 'hoplite', 3), revealed: true, ongoingPowerModifier: 2 };
+    let state = createTestGameState(2);
+    state = placeCardAtLocation(state, ally, 0);
+    state = { ...state, silencedCards: [1] };
+    
+    const result = executeTimeline(state, [createOngoingRecalcStep(0)], new SeededRNG(42));
+    
+    expect(result.success).toBe(true);
+    expect(findCard(result.state, 1)?.ongoingPowerModifier).toBe(0);
+    expect(result.state.silencedCards).toEqual([]);
+    expect(result.events.filter(e => e.type === 'PowerChanged')).toEqual([]);
+  });
+  
+  it('applies a scaling buff whose count and targets are the same selector', () => {
+    // +1 to each ally here per ally here (itself included): 3 allies -> +3 each
+    const source = createOngoingCard(1, 0, 1, [{
+      type: 'ScalingOngoingPowerEffect',
+      target: 'SAME_LOCATION_FRIENDLY',
+      perCardAmount: 1,
+      countFilter: 'SAME_LOCATION_FRIENDLY',
+    }]);
+    let state = createTestGameState(3);
+    state = placeCardAtLocation(state, source, 0);
+    state = placeCardAtLocation(state, { ...createTestCardInstance(2, 0), revealed: true }, 0);
+    state = placeCardAtLocation(state, { ...createTestCardInstance(3, 0), revealed: true }, 0);
+    state = placeCardAtLocation(state, { ...createTestCardInstance(4, 0), revealed: true }, 1);
+    state = placeCardAtLocation(state, { ...createTestCardInstance(5, 1), revealed: true }, 0);
+    
+    const result = executeTimeline(state, [createOngoingRecalcStep(0)], new SeededRNG(42));
+    
+    expect(findCard(result.state, 1)?.ongoingPowerModifier).toBe(3);
+    expect(findCard(result.state, 2)?.ongoingPowerModifier).toBe(3);
+    expect(findCard(result.state, 3)?.ongoingPowerModifier).toBe(3);
+    expect(findCard(result.state, 4)?.ongoingPowerModifier).toBe(0); // Other location
+    expect(findCard(result.state, 5)?.ongoingPowerModifier).toBe(0); // Enemy
+    
+    // Only buffs on other cards are announced, each credited to the source
+    const powerChanges = result.events.filter(e => e.type === 'PowerChanged');
+    expect(powerChanges).toEqual([
+      { type: 'PowerChanged', cardInstanceId: 2, oldPower: 3, newPower: 6, sourceCardId: 1 },
+      { type: 'PowerChanged', cardInstanceId: 3, oldPower: 3, newPower: 6, sourceCardId: 1 },
+    ]);
+  });
+  
+  it('drops the buffs of a silenced ONGOING source', () => {
+    const buff: Effect[] = [{ type: 'AddOngoingPowerEffect', target: 'SAME_LOCATION_FRIENDLY_EXCEPT_SELF', amount: 2 }];
+    const silence: Effect[] = [{ type: 'SilenceOngoingEffect', target: 'SAME_LOCATION_ENEMY' }];
+    let state = createTestGameState(4);
+    // Location 0: the buffer is silenced; the ally still carries last turn's +2
+    state = placeCardAtLocation(state, createOngoingCard(1, 0, 2, buff), 0);
+    state = placeCardAtLocation(state, { ...createTestCardInstance(2, 0), revealed: true, ongoingPowerModifier: 2 }, 0);
+    state = placeCardAtLocation(state, createOngoingCard(3, 1, 1, silence), 0);
+    // Location 1: the same buffer, unsilenced
+    state = placeCardAtLocation(state, createOngoingCard(4, 0, 2, buff), 1);
+    state = placeCardAtLocation(state, { ...createTestCardInstance(5, 0), revealed: true }, 1);
+    
+    const result = executeTimeline(state, [createOngoingRecalcStep(0)], new SeededRNG(42));
+    
+    expect(result.state.silencedCards).toEqual([1, 2]);
+    expect(findCard(result.state, 2)?.ongoingPowerModifier).toBe(0);
+    expect(findCard(result.state, 5)?.ongoingPowerModifier).toBe(2);
+    
+    const powerChanges = result.events.filter(e => e.type === 'PowerChanged');
+    expect(powerChanges).toEqual([
+      { type: 'PowerChanged', cardInstanceId: 5, oldPower: 3, newPower: 5, sourceCardId: 4 },
+    ]);
+  });
+});
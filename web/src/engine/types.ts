@@ -40,6 +40,12 @@ export const STARTING_HAND_SIZE = 3;
 export const DECK_SIZE = 24;
 export const MAX_HAND_SIZE = 7;
 
+/** All location indices, left to right */
+export const ALL_LOCATIONS: LocationTuple<LocationIndex> = [0, 1, 2];
+
+/** Both player ids */
+export const BOTH_PLAYERS: PlayerTuple<PlayerId> = [0, 1];
+
 // =============================================================================
 // Enums
 // =============================================================================
@@ -24,6 +24,7 @@ import {
   startNextTurnWithSimpleDraw,
   validateAction,
   computeWinner,
+  applyCardPlay,
   type DeterministicResolutionResult,
 } from '@engine/controller';
 import { withResult } from '@engine/models';
@@ -40,51 +41,15 @@ import { computeGreedyAction, getDifficultyForPosition } from '../ai/greedy';
 import {
   getPlayer,
   withPlayer,
-  withLocation,
-  getLocation,
   getTotalPower,
   withEnergy,
   withHand,
-  removeFromHand,
-  spendEnergy,
-  addCard,
 } from '@engine/models';
 import { getCardDef, createCardInstance, getAllCardDefs } from '@engine/cards';
+import { getDefaultStarterDeck } from '@engine/starterDeck';
 import type { CardId } from '@engine/types';
 import { usePlayerStore } from './playerStore';
 
-/**
- * Apply a card play immediately to the game state.
- * This is used for both player plays (during planning) and when resolving the turn.
- */
-function applyCardPlay(
-  state: GameState,
-  action: PlayCardAction
-): GameState {
-  const { playerId, cardInstanceId, location: locationIndex } = action;
-  const player = getPlayer(state, playerId);
-
-  // Remove card from hand
-  const [playerWithoutCard, card] = removeFromHand(player, cardInstanceId);
-  if (!card) return state;
-
-  // Spend energy
-  const playerSpent = spendEnergy(playerWithoutCard, card.cardDef.cost);
-  let newState = withPlayer(state, playerId, playerSpent);
-
-  // Add card to location (unrevealed for player, revealed depends on context)
-  const playedCard: CardInstance = {
-    ...card,
-    revealed: playerId === 0, // Player cards shown immediately, NPC hidden until reveal
-  };
-
-  const location = getLocation(newState, locationIndex);
-  const newLocation = addCard(location, playedCard, playerId);
-  newState = withLocation(newState, locationIndex, newLocation);
-
-  return newState;
-}
-
 interface GameStore {
   // State
   gameState: GameState | null;
@@ -277,8 +242,9 @@ export const useGameStore = create<GameStore>((set, get) => ({
       return;
     }
 
-    // Apply the card play immediately
-    const newState = applyCardPlay(gameState, action);
+    // Apply the card play immediately (player cards are shown at once,
+    // NPC cards stay hidden until reveal)
+    const newState = applyCardPlay(gameState, action, action.playerId === 0);
 
     set({
       gameState: newState,
@@ -318,7 +284,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
     // Rebuild state from turnStartState by replaying updated actions
     let newState = turnStartState;
     for (const action of newActions) {
-      newState = applyCardPlay(newState, action);
+      newState = applyCardPlay(newState, action, action.playerId === 0);
     }
 
     set({
@@ -379,7 +345,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
       // Now resolve the turn using the DETERMINISTIC system
       // Process player and NPC actions in pairs
       let resolvedState = turnStartState;
-      let allEvents: GameEvent[] = [];
+      const allEvents: GameEvent[] = [];
       let lastTimeline: ResolutionTimeline | null = null;
 
       const maxPlays = Math.max(playerActions.length, npcActionsForResolution.length);
@@ -397,7 +363,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
         );
         
         resolvedState = result.state;
-        allEvents = [...allEvents, ...result.events];
+        allEvents.push(...result.events);
         lastTimeline = result.timeline;
         
         if (!result.success) {
@@ -414,27 +380,28 @@ export const useGameStore = create<GameStore>((set, get) => ({
           turnRng
         );
         resolvedState = result.state;
-        allEvents = [...allEvents, ...result.events];
+        allEvents.push(...result.events);
         lastTimeline = result.timeline;
       }
       
       // Store the timeline for debugging/replay
       set({ currentTimeline: lastTimeline });
 
-      // Filter out PowerChanged events that target different cards (buff/debuff effects)
-      const powerChangedEvents = allEvents.filter(
-        (e): e is GameEvent & { type: 'PowerChanged' } =>
-          e.type === 'PowerChanged' &&
-          'sourceCardId' in e &&
-          'cardInstanceId' in e &&
-          (e as { sourceCardId: number; cardInstanceId: number }).sourceCardId !==
-          (e as { sourceCardId: number; cardInstanceId: number }).cardInstanceId
-      );
-
-      // Filter CardDestroyed events
-      const cardDestroyedEvents = allEvents.filter(
-        (e): e is GameEvent & { type: 'CardDestroyed' } => e.type === 'CardDestroyed'
-      );
+      // Partition the resolution events in a single pass:
+      // PowerChanged events that target different cards (buff/debuff effects),
+      // CardDestroyed events, and whether any card moved
+      const powerChangedEvents: GameEvent[] = [];
+      const cardDestroyedEvents: GameEvent[] = [];
+      let hasMoveEvents = false;
+      for (const e of allEvents) {
+        if (e.type === 'PowerChanged') {
+          if (e.sourceCardId !== e.cardInstanceId) powerChangedEvents.push(e);
+        } else if (e.type === 'CardDestroyed') {
+          cardDestroyedEvents.push(e);
+        } else if (e.type === 'CardMoved') {
+          hasMoveEvents = true;
+        }
+      }
 
       // Calculate current location winners for animation
       const currentLocationWinners = resolvedState.locations.map(loc => {
@@ -452,17 +419,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
       
       // Apply all player actions with revealed=true
       for (const action of playerActions) {
-        const player = getPlayer(preAnimationState, action.playerId);
-        const [playerWithoutCard, card] = removeFromHand(player, action.cardInstanceId);
-        if (!card) continue;
-        
-        const playerSpent = spendEnergy(playerWithoutCard, card.cardDef.cost);
-        preAnimationState = withPlayer(preAnimationState, action.playerId, playerSpent);
-        
-        const playedCard: CardInstance = { ...card, revealed: true };
-        const location = getLocation(preAnimationState, action.location);
-        const newLocation = addCard(location, playedCard, action.playerId);
-        preAnimationState = withLocation(preAnimationState, action.location, newLocation);
+        preAnimationState = applyCardPlay(preAnimationState, action, true);
       }
       
       // Track NPC card IDs for staggered reveal animation
@@ -470,17 +427,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
       
       // Apply all NPC actions with revealed=true
       for (const action of npcActions) {
-        const player = getPlayer(preAnimationState, action.playerId);
-        const [playerWithoutCard, card] = removeFromHand(player, action.cardInstanceId);
-        if (!card) continue;
-        
-        const playerSpent = spendEnergy(playerWithoutCard, card.cardDef.cost);
-        preAnimationState = withPlayer(preAnimationState, action.playerId, playerSpent);
-        
-        const playedCard: CardInstance = { ...card, revealed: true };
-        const location = getLocation(preAnimationState, action.location);
-        const newLocation = addCard(location, playedCard, action.playerId);
-        preAnimationState = withLocation(preAnimationState, action.location, newLocation);
+        preAnimationState = applyCardPlay(preAnimationState, action, true);
       }
 
       // FIRST: Update gameState to show ALL cards (including NPC's) before animations
@@ -545,8 +492,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
       });
 
       // Wait for move animations to complete (they are triggered by the state change and handled by layoutId)
-      const moveEvents = allEvents.filter(e => e.type === 'CardMoved');
-      if (moveEvents.length > 0) {
+      if (hasMoveEvents) {
         await new Promise(resolve => setTimeout(resolve, 800)); // EVENT_ANIMATIONS.CardMoved is 0.7s
       }
 
@@ -882,8 +828,6 @@ if (typeof window !== 'undefined') {
     },
     /** Reset all - clears player profile (unlocks, credits, stats) and starts fresh */
     resetAll: async () => {
-      // Import dynamically to avoid circular dependencies
-      const { getDefaultStarterDeck } = await import('@engine/starterDeck');
       const starterDeck = getDefaultStarterDeck();
       
       // Reset player profile